@@ -1,16 +1,120 @@
 """Core auto-clicker engine — runs clicks in a background thread."""
 
+import array
+import ctypes
+import itertools
+import os
+import sys
 import threading
 import time
 from .logging_config import logger
+from .constants import MOUSE_BUTTON_MAP
 
-try:
-    import pyautogui
-except ImportError as e:
-    logger.error("Failed to import pyautogui: %s", e)
-    pyautogui = None
+# The last stretch of each interval is busy-waited on the performance
+# counter; OS sleeps are too coarse (1–15 ms on Windows) for short intervals.
+_SPIN_NS = 2_000_000
 
-from .constants import MOUSE_BUTTON_MAP
+# ── Native Win32 input (bypasses pyautogui's per-call overhead) ──────
+INPUT_MOUSE = 0
+_MOUSE_FLAGS = {
+    "left": (0x0002, 0x0004),     # MOUSEEVENTF_LEFTDOWN / LEFTUP
+    "right": (0x0008, 0x0010),    # MOUSEEVENTF_RIGHTDOWN / RIGHTUP
+    "middle": (0x0020, 0x0040),   # MOUSEEVENTF_MIDDLEDOWN / MIDDLEUP
+}
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUT(ctypes.Structure):
+    # MOUSEINPUT is the largest member of the INPUT union, so it alone
+    # gives the struct the size SendInput expects
+    _fields_ = [("type", ctypes.c_ulong), ("mi", _MOUSEINPUT)]
+
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    # Declared once so the per-click calls skip ctypes' argument inference
+    _user32 = ctypes.windll.user32
+    _user32.SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int]
+    _user32.SendInput.restype = wintypes.UINT
+    _user32.SetCursorPos.argtypes = [ctypes.c_int, ctypes.c_int]
+    _user32.SetCursorPos.restype = wintypes.BOOL
+
+
+def _make_click(button: str, clicks: int, pyautogui=None):
+    """Return a zero-arg callable that performs one (single or double) click."""
+    if sys.platform == "win32":
+        down, up = _MOUSE_FLAGS.get(button, _MOUSE_FLAGS["left"])
+        count = clicks * 2
+        inputs = (_INPUT * count)()
+        for i in range(count):
+            inputs[i].type = INPUT_MOUSE
+            inputs[i].mi.dwFlags = up if i % 2 else down
+        size = ctypes.sizeof(_INPUT)
+        send_input = _user32.SendInput
+        return lambda: send_input(count, inputs, size)
+    return lambda: pyautogui.click(clicks=clicks, button=button)
+
+
+def _make_move(pyautogui=None):
+    """Return a callable that moves the cursor to absolute (x, y)."""
+    if sys.platform == "win32":
+        return _user32.SetCursorPos
+    return pyautogui.moveTo
+
+
+# pyautogui module once imported and configured (non-Windows fallback only)
+_pyautogui = None
+
+
+def _configure_pyautogui():
+    """Import pyautogui and apply its process-wide settings exactly once.
+
+    Returns the module, or None if it is not installed.
+    """
+    global _pyautogui
+    if _pyautogui is None:
+        try:
+            import pyautogui
+        except ImportError as e:
+            logger.error("pyautogui not available — clicking disabled: %s", e)
+            return None
+        # Disable pyautogui fail-safe (mouse-to-corner abort)
+        # Users control via hotkey instead
+        pyautogui.FAILSAFE = False
+        pyautogui.PAUSE = 0
+        _pyautogui = pyautogui
+        logger.info("pyautogui initialized")
+    return _pyautogui
+
+
+def _noop(*_args):
+    pass
+
+
+def _raise_thread_priority():
+    """Move the calling thread to the highest scheduling tier available."""
+    try:
+        if sys.platform == "win32":
+            THREAD_PRIORITY_TIME_CRITICAL = 15
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(),
+                                       THREAD_PRIORITY_TIME_CRITICAL)
+        elif hasattr(os, "sched_setscheduler"):
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(50))
+    except OSError as e:
+        # Realtime scheduling usually needs elevated privileges on Linux
+        logger.info("Could not raise click thread priority: %s", e)
 
 
 class ClickerEngine:
@@ -19,28 +123,37 @@ class ClickerEngine:
     def __init__(self):
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
-        self._click_count = 0
+        self._exited = threading.Event()   # set once the click loop has returned
+        self._exited.set()
+        # Single-slot counter bumped in place by the click thread; the UI
+        # polls it through ``click_count`` instead of receiving a callback
+        self._count = array.array("q", [0])
         self._running = False
-        self._on_status_change = None
-        self._on_click_count_update = None
-
-        # Disable pyautogui fail-safe (mouse-to-corner abort)
-        # Users control via hotkey instead
-        if pyautogui:
-            pyautogui.FAILSAFE = False
-            pyautogui.PAUSE = 0
-            logger.info("pyautogui initialized")
-        else:
-            logger.error("pyautogui not available — clicking disabled")
+        self.set_callbacks()
+        self._do_move = None
+        self._do_click = None
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def set_callbacks(self, on_status_change=None, on_click_count_update=None):
-        """Register UI callbacks."""
+    def set_callbacks(self, on_status_change=None):
+        """Register UI callbacks.
+
+        The notify hook is bound here — to a guarded call or a no-op — so
+        callers never re-check whether a callback is registered.
+        """
         self._on_status_change = on_status_change
-        self._on_click_count_update = on_click_count_update
+
+        if on_status_change is None:
+            self._notify_status = _noop
+        else:
+            def _notify_status(running: bool):
+                try:
+                    on_status_change(running)
+                except Exception:
+                    pass
+            self._notify_status = _notify_status
 
     @property
     def running(self) -> bool:
@@ -48,7 +161,7 @@ class ClickerEngine:
 
     @property
     def click_count(self) -> int:
-        return self._click_count
+        return self._count[0]
 
     def start(
         self,
@@ -71,23 +184,44 @@ class ClickerEngine:
         if self._running:
             return
 
+        # Windows clicks natively; elsewhere fall back to pyautogui
+        pg = None
+        if sys.platform != "win32":
+            pg = _configure_pyautogui()
+            if pg is None:
+                return
+
+        # Resolve the button and build the native click inputs up front
+        button = MOUSE_BUTTON_MAP.get(mouse_button, "left")
+        clicks = 2 if click_type == "Double" else 1
+        self._do_click = _make_click(button, clicks, pg)
+        self._do_move = _make_move(pg)
+
+        # Pack targets into one contiguous C-int buffer (x0, y0, x1, y1, ...);
+        # this also rejects anything that isn't a valid SetCursorPos coordinate
+        coords = array.array("i")
+        for x, y in locations:
+            coords.extend((int(x), int(y)))
+
         self._stop_event.clear()
-        self._click_count = 0
+        self._exited.clear()
+        self._count[0] = 0
         self._running = True
         self._notify_status(True)
 
         self._thread = threading.Thread(
             target=self._click_loop,
-            args=(locations, interval_ms, repeat_count, mouse_button, click_type),
+            args=(coords, interval_ms, repeat_count),
             daemon=True,
         )
         self._thread.start()
 
     def stop(self):
-        """Stop clicking."""
+        """Stop clicking and wait briefly for the click thread to exit."""
         if not self._running:
             return
         self._stop_event.set()
+        self._exited.wait(timeout=1.0)
         self._running = False
         self._notify_status(False)
 
@@ -95,51 +229,67 @@ class ClickerEngine:
     # Internal
     # ------------------------------------------------------------------
 
-    def _click_loop(self, locations, interval_ms, repeat_count, mouse_button, click_type):
-        button = MOUSE_BUTTON_MAP.get(mouse_button, "left")
-        clicks = 2 if click_type == "Double" else 1
-        interval_s = interval_ms / 1000.0
-        use_locations = len(locations) > 0
-        loc_index = 0
-
-        while not self._stop_event.is_set():
-            # Move to target location if configured
-            if use_locations:
-                x, y = locations[loc_index % len(locations)]
-                pyautogui.moveTo(x, y)
-                loc_index += 1
-
-            # Perform click
-            pyautogui.click(clicks=clicks, button=button)
-            self._click_count += 1
-            self._notify_click_count()
-
-            # Check repeat limit
-            if repeat_count > 0 and self._click_count >= repeat_count:
-                break
-
-            # Wait for the interval, but check stop event frequently
-            # so we can respond quickly to stop requests
-            if interval_s > 0:
-                wait_end = time.perf_counter() + interval_s
-                while time.perf_counter() < wait_end:
-                    if self._stop_event.is_set():
-                        break
-                    time.sleep(min(0.01, interval_s))
+    def _click_loop(self, coords, interval_ms, repeat_count):
+        interval_ns = interval_ms * 1_000_000
+        loc_iter = itertools.cycle(zip(coords[0::2], coords[1::2])) if coords else None
+
+        # Local aliases keep attribute lookups out of the hot loop
+        stopped = self._stop_event.is_set
+        do_click = self._do_click
+        do_move = self._do_move
+        wait_interval = self._wait_interval
+        count = self._count
+
+        # Specialize the loop body up front: clicking in place is just the
+        # prebuilt click, and "until stopped" becomes an unreachable limit
+        if loc_iter is None:
+            step = do_click
+        else:
+            def step():
+                x, y = next(loc_iter)
+                do_move(x, y)
+                do_click()
+        limit = repeat_count if repeat_count > 0 else sys.maxsize
+
+        _raise_thread_priority()
+
+        # Raise the system timer resolution to 1 ms for the duration of the run
+        if sys.platform == "win32":
+            ctypes.windll.winmm.timeBeginPeriod(1)
+        try:
+            while not stopped():
+                step()
+                count[0] += 1
+
+                if count[0] >= limit:
+                    break
+
+                if interval_ns > 0 and wait_interval(interval_ns):
+                    break
+        finally:
+            if sys.platform == "win32":
+                ctypes.windll.winmm.timeEndPeriod(1)
+            # Signal before the UI callback below, which may need the
+            # main thread that stop() is blocking
+            self._exited.set()
 
         self._running = False
         self._notify_status(False)
 
-    def _notify_status(self, running: bool):
-        if self._on_status_change:
-            try:
-                self._on_status_change(running)
-            except Exception:
-                pass
-
-    def _notify_click_count(self):
-        if self._on_click_count_update:
-            try:
-                self._on_click_count_update(self._click_count)
-            except Exception:
-                pass
+    def _wait_interval(self, interval_ns: int) -> bool:
+        """Sleep for *interval_ns*, returning True if stop() was called.
+
+        Blocks on the stop event for the bulk of the interval, then spins
+        on the performance counter for the final ``_SPIN_NS`` so short
+        intervals keep an accurate cadence.
+        """
+        now = time.perf_counter_ns
+        stopped = self._stop_event.is_set
+        deadline = now() + interval_ns
+        coarse_ns = interval_ns - _SPIN_NS
+        if coarse_ns > 0 and self._stop_event.wait(timeout=coarse_ns / 1e9):
+            return True
+        while now() < deadline:
+            if stopped():
+                return True
+        return False
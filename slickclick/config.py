@@ -25,23 +25,45 @@ DEFAULTS = {
 }
 
 
+# In-process cache of the parsed file, invalidated by its modification time
+_cache: dict | None = None
+_cache_mtime = -1
+
+# Whether _APP_DIR has been created during this process
+_dir_ready = False
+
+
 def load() -> dict:
     """Load settings from disk, returning defaults for any missing keys."""
-    data = dict(DEFAULTS)
+    global _cache, _cache_mtime
     try:
+        mtime = os.stat(CONFIG_PATH).st_mtime_ns
+        if _cache is not None and mtime == _cache_mtime:
+            return dict(_cache)
         with open(CONFIG_PATH, "r", encoding="utf-8") as f:
             saved = json.load(f)
-        data.update(saved)
     except (FileNotFoundError, json.JSONDecodeError, OSError):
-        pass
-    return data
+        return dict(DEFAULTS)
+    # Cache the merged result so cache hits skip the merge entirely
+    _cache, _cache_mtime = {**DEFAULTS, **saved}, mtime
+    return dict(_cache)
 
 
 def save(settings: dict) -> None:
-    """Save settings to disk."""
+    """Save settings to disk.
+
+    Writes to a temp file and swaps it into place so a crash mid-write
+    never leaves a truncated config behind.
+    """
+    global _cache, _cache_mtime, _dir_ready
+    tmp_path = CONFIG_PATH + ".tmp"
     try:
-        os.makedirs(_APP_DIR, exist_ok=True)
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2)
+        if not _dir_ready:
+            os.makedirs(_APP_DIR, exist_ok=True)
+            _dir_ready = True
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(settings, separators=(",", ":")))
+        os.replace(tmp_path, CONFIG_PATH)
+        _cache, _cache_mtime = {**DEFAULTS, **settings}, os.stat(CONFIG_PATH).st_mtime_ns
     except OSError:
         pass
@@ -2,6 +2,7 @@
 
 import os
 import sys
+from types import MappingProxyType
 
 APP_NAME = "SlickClick"
 APP_VERSION = "1.3.2"
@@ -24,11 +25,11 @@ DEFAULT_HOTKEY = "F6"
 
 # Mouse buttons
 MOUSE_BUTTONS = ["Left", "Right", "Middle"]
-MOUSE_BUTTON_MAP = {
+MOUSE_BUTTON_MAP = MappingProxyType({
     "Left": "left",
     "Right": "right",
     "Middle": "middle",
-}
+})
 
 # Click types
 CLICK_TYPES = ["Single", "Double"]
@@ -37,8 +38,8 @@ CLICK_TYPES = ["Single", "Double"]
 REPEAT_FINITE = "finite"
 REPEAT_INFINITE = "infinite"
 
-# Theme colors (dark theme)
-COLORS = {
+# Theme colors (dark theme) — read-only so no module can mutate the palette
+COLORS = MappingProxyType({
     "bg_dark": "#1a1a2e",
     "bg_medium": "#16213e",
     "bg_light": "#0f3460",
@@ -58,4 +59,4 @@ COLORS = {
     "button_hover": "#2d4068",
     "listbox_bg": "#12192b",
     "listbox_select": "#0f3460",
-}
+})
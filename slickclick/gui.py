@@ -1,9 +1,13 @@
 """SlickClick GUI — Modern inline-controls layout matching the landing page design."""
 
 import ctypes
+import ctypes.wintypes as wintypes
+import functools
 import sys
 import tkinter as tk
+from collections.abc import Sequence
 from tkinter import ttk
+from types import MappingProxyType
 
 from .constants import (
     APP_NAME,
@@ -16,10 +20,64 @@ from .constants import (
     DEFAULT_HOTKEY,
 )
 
+# Palette colors hoisted to module constants for the widget builders below
+_BG_DARK = COLORS["bg_dark"]
+_BG_MEDIUM = COLORS["bg_medium"]
+_BG_LIGHT = COLORS["bg_light"]
+_BG_CARD = COLORS["bg_card"]
+_ACCENT = COLORS["accent"]
+_ACCENT_HOVER = COLORS["accent_hover"]
+_ACCENT_DIM = COLORS["accent_dim"]
+_TEXT_PRIMARY = COLORS["text_primary"]
+_TEXT_SECONDARY = COLORS["text_secondary"]
+_TEXT_MUTED = COLORS["text_muted"]
+_BORDER = COLORS["border"]
+_SUCCESS = COLORS["success"]
+_WARNING = COLORS["warning"]
+_INPUT_BG = COLORS["input_bg"]
+_BUTTON_BG = COLORS["button_bg"]
+_BUTTON_HOVER = COLORS["button_hover"]
+_LISTBOX_BG = COLORS["listbox_bg"]
+_LISTBOX_SELECT = COLORS["listbox_select"]
+
+# Preset widget factories for the styles built over and over
+_SectionLabel = functools.partial(
+    tk.Label, font=("Segoe UI", 7, "bold"), fg=_TEXT_MUTED, bg=_BG_CARD, anchor="w",
+)
+_DialogButton = functools.partial(
+    tk.Button, font=("Segoe UI", 9), bg=_BUTTON_BG, fg=_TEXT_PRIMARY,
+    activebackground=_BUTTON_HOVER, activeforeground=_TEXT_PRIMARY,
+    relief="flat", borderwidth=0, padx=16, pady=3,
+)
+
+# Resolve and prototype the DWM entry point once rather than per call
+if sys.platform == "win32":
+    try:
+        _DwmSetWindowAttribute = ctypes.windll.dwmapi.DwmSetWindowAttribute
+        _DwmSetWindowAttribute.argtypes = [
+            wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD,
+        ]
+        _DwmSetWindowAttribute.restype = ctypes.c_long
+    except (OSError, AttributeError):
+        _DwmSetWindowAttribute = None
+else:
+    _DwmSetWindowAttribute = None
+
+
+def _is_digits(proposed: str) -> bool:
+    """Entry validator: allow only empty text or an unsigned integer.
+
+    ASCII only — isdigit() alone also passes characters like "²" that
+    int() then rejects.
+    """
+    return proposed == "" or (proposed.isascii() and proposed.isdecimal())
+
 
 class SlickClickGUI:
     """Modern main window with all controls visible inline."""
 
+    _styles_initialized = False
+
     def __init__(self, root: tk.Tk):
         self.root = root
 
@@ -36,15 +94,42 @@ class SlickClickGUI:
         self.target_mode = tk.StringVar(value="cursor")
         self.start_delay_var = tk.StringVar(value="0")
         self._locations: list[tuple[int, int]] = []
+        # Viewer row text for a prefix of _locations; extended lazily and
+        # truncated from the first removed index
+        self._location_labels: list[str] = []
         self._hotkey_name = DEFAULT_HOTKEY
+        self._dlg_cache: dict[str, tk.Toplevel] = {}
+        # Built with the (cached) settings dialog; None until first opened
+        self._settings_hotkey_label: tk.Label | None = None
+        self._set_hotkey_btn: tk.Button | None = None
+        self._loc_indicator_pending = False
+        self._last_count = -1              # value currently shown in count_label
         self.show_toast = tk.BooleanVar(value=True)
         self.show_osd = tk.BooleanVar(value=True)
 
+        # Python-side copy of the interval fields, kept current by traces so
+        # get_interval_ms() needs no Tcl round-trips or parsing.  None marks
+        # an empty field.
+        self._interval_cache = {"h": 0, "m": 0, "s": 0, "ms": DEFAULT_INTERVAL_MS}
+        for key, var in (("h", self.hours_var), ("m", self.mins_var),
+                         ("s", self.secs_var), ("ms", self.ms_var)):
+            var.trace_add("write", lambda *_a, k=key, v=var: self._on_interval_changed(k, v))
+        self._digits_vcmd = (self.root.register(_is_digits), "%P")
+
+        # Same idea for the repeat count and start delay; the fallbacks
+        # apply while a field is empty
+        self._repeat_count = 50
+        self._start_delay = 0
+        self.repeat_count_var.trace_add(
+            "write", lambda *_a: self._mirror_int(self.repeat_count_var, "_repeat_count", 10))
+        self.start_delay_var.trace_add(
+            "write", lambda *_a: self._mirror_int(self.start_delay_var, "_start_delay", 0))
+
         # Display var for the inline repeat combo
         self._repeat_display_var = tk.StringVar(value="Until Stopped")
-        self._repeat_display_var.trace_add("write", self._on_repeat_display_changed)
 
         self._setup_window()
+        self._build_gear_menu()
         self._build_main_content()
 
     # ------------------------------------------------------------------
@@ -66,9 +151,11 @@ class SlickClickGUI:
 
         self.root.minsize(420, 510)
         self.root.resizable(True, True)
-        self.root.configure(bg=COLORS["bg_dark"])
+        self.root.configure(bg=_BG_DARK)
         try:
-            self.root.iconbitmap(ICON_PATH)
+            # default= makes every Toplevel inherit the icon, so the .ico is
+            # read from disk once instead of per window
+            self.root.iconbitmap(default=ICON_PATH)
         except Exception:
             pass
 
@@ -76,40 +163,52 @@ class SlickClickGUI:
         self._apply_dark_title_bar()
 
         # ── ttk dark theme styling ───────────────────────────
+        # The palette is constant, so the style and option database only
+        # need populating once per interpreter
+        if not SlickClickGUI._styles_initialized:
+            self._init_styles()
+            SlickClickGUI._styles_initialized = True
+
+    def _init_styles(self):
+        """Configure the dark ttk theme and the combobox dropdown colors."""
         style = ttk.Style()
         style.theme_use("clam")  # clam allows full color customization
 
         # Combobox styling
         style.configure(
             "Dark.TCombobox",
-            fieldbackground=COLORS["input_bg"],
-            background=COLORS["button_bg"],
-            foreground=COLORS["text_primary"],
-            arrowcolor=COLORS["text_secondary"],
-            bordercolor=COLORS["border"],
-            lightcolor=COLORS["border"],
-            darkcolor=COLORS["border"],
-            selectbackground=COLORS["bg_light"],
-            selectforeground=COLORS["text_primary"],
+            fieldbackground=_INPUT_BG,
+            background=_BUTTON_BG,
+            foreground=_TEXT_PRIMARY,
+            arrowcolor=_TEXT_SECONDARY,
+            bordercolor=_BORDER,
+            lightcolor=_BORDER,
+            darkcolor=_BORDER,
+            selectbackground=_BG_LIGHT,
+            selectforeground=_TEXT_PRIMARY,
             padding=(8, 6),
         )
         style.map(
             "Dark.TCombobox",
-            fieldbackground=[("readonly", COLORS["input_bg"])],
-            foreground=[("readonly", COLORS["text_primary"])],
-            selectbackground=[("readonly", COLORS["input_bg"])],
-            selectforeground=[("readonly", COLORS["text_primary"])],
-            background=[("active", COLORS["button_hover"]),
-                        ("pressed", COLORS["button_hover"])],
-            bordercolor=[("focus", COLORS["accent_dim"])],
+            fieldbackground=[("readonly", _INPUT_BG)],
+            foreground=[("readonly", _TEXT_PRIMARY)],
+            selectbackground=[("readonly", _INPUT_BG)],
+            selectforeground=[("readonly", _TEXT_PRIMARY)],
+            background=[("active", _BUTTON_HOVER),
+                        ("pressed", _BUTTON_HOVER)],
+            bordercolor=[("focus", _ACCENT_DIM)],
         )
 
-        # Combobox dropdown listbox (requires option_add)
-        self.root.option_add("*TCombobox*Listbox.background", COLORS["input_bg"])
-        self.root.option_add("*TCombobox*Listbox.foreground", COLORS["text_primary"])
-        self.root.option_add("*TCombobox*Listbox.selectBackground", COLORS["bg_light"])
-        self.root.option_add("*TCombobox*Listbox.selectForeground", COLORS["text_primary"])
-        self.root.option_add("*TCombobox*Listbox.font", ("Segoe UI", 11))
+        # Combobox dropdown listbox (requires option_add). widgetDefault is
+        # the lowest useful priority, keeping these cheap to match/override.
+        for option, value in (
+            ("background", _INPUT_BG),
+            ("foreground", _TEXT_PRIMARY),
+            ("selectBackground", _BG_LIGHT),
+            ("selectForeground", _TEXT_PRIMARY),
+            ("font", ("Segoe UI", 11)),
+        ):
+            self.root.option_add(f"*TCombobox*Listbox.{option}", value, "widgetDefault")
 
     # ------------------------------------------------------------------
     # Dark title bar (Windows DWM API)
@@ -117,7 +216,7 @@ class SlickClickGUI:
 
     def _apply_dark_title_bar(self):
         """Use Windows DWM API to enable dark title bar and window border."""
-        if sys.platform != "win32":
+        if _DwmSetWindowAttribute is None:
             return
         try:
             self.root.update_idletasks()
@@ -125,7 +224,7 @@ class SlickClickGUI:
             # DWMWA_USE_IMMERSIVE_DARK_MODE = 20 (Windows 10 20H1+)
             DWMWA_USE_IMMERSIVE_DARK_MODE = 20
             value = ctypes.c_int(1)
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(
+            _DwmSetWindowAttribute(
                 hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE,
                 ctypes.byref(value), ctypes.sizeof(value),
             )
@@ -134,7 +233,7 @@ class SlickClickGUI:
                 DWMWA_BORDER_COLOR = 34
                 # Convert #1a1a2e → 0x002E1A1A (COLORREF = 0x00BBGGRR)
                 border_colorref = ctypes.c_int(0x002E1A1A)
-                ctypes.windll.dwmapi.DwmSetWindowAttribute(
+                _DwmSetWindowAttribute(
                     hwnd, DWMWA_BORDER_COLOR,
                     ctypes.byref(border_colorref), ctypes.sizeof(border_colorref),
                 )
@@ -147,15 +246,15 @@ class SlickClickGUI:
     # Context menu (replaces classic menu bar)
     # ------------------------------------------------------------------
 
-    _MENU_OPTS = dict(
-        tearoff=0, bg=COLORS["bg_medium"], fg=COLORS["text_primary"],
-        activebackground=COLORS["accent"], activeforeground="white",
+    _MENU_OPTS = MappingProxyType(dict(
+        tearoff=0, bg=_BG_MEDIUM, fg=_TEXT_PRIMARY,
+        activebackground=_ACCENT, activeforeground="white",
         borderwidth=0, relief="flat",
         activeborderwidth=0, font=("Segoe UI", 9),
-    )
+    ))
 
-    def _show_gear_menu(self, event):
-        """Show context menu from the gear icon."""
+    def _build_gear_menu(self):
+        """Build the gear context menu once; it is re-posted on every click."""
         menu = tk.Menu(self.root, **self._MENU_OPTS)
 
         # Clicking options
@@ -172,11 +271,14 @@ class SlickClickGUI:
         menu.add_command(label="  ℹ  About", command=self._show_about)
         menu.add_separator()
         menu.add_command(label="  ✕  Exit", command=lambda: self._on_close())
+        self._gear_menu = menu
 
+    def _show_gear_menu(self, event):
+        """Show context menu from the gear icon."""
         try:
-            menu.tk_popup(event.x_root, event.y_root)
+            self._gear_menu.tk_popup(event.x_root, event.y_root)
         finally:
-            menu.grab_release()
+            self._gear_menu.grab_release()
 
     # ------------------------------------------------------------------
     # Main window content — inline controls matching landing page mockup
@@ -184,208 +286,212 @@ class SlickClickGUI:
 
     def _build_main_content(self):
         # Card container
-        card = tk.Frame(self.root, bg=COLORS["bg_card"])
+        card = tk.Frame(self.root, bg=_BG_CARD)
         card.pack(fill="both", expand=True, padx=14, pady=(10, 14))
 
         # ── Accent top line ──────────────────────────────────
-        accent_line = tk.Frame(card, bg=COLORS["accent"], height=3)
+        accent_line = tk.Frame(card, bg=_ACCENT, height=3)
         accent_line.pack(fill="x")
 
         # ── Header row: app name + gear icon ─────────────────
-        header = tk.Frame(card, bg=COLORS["bg_card"])
+        header = tk.Frame(card, bg=_BG_CARD)
         header.pack(fill="x", padx=20, pady=(12, 4))
 
         tk.Label(
             header, text=APP_NAME, font=("Segoe UI", 11, "bold"),
-            fg=COLORS["text_secondary"], bg=COLORS["bg_card"],
+            fg=_TEXT_SECONDARY, bg=_BG_CARD,
         ).pack(side="left")
 
         tk.Label(
             header, text=f"v{APP_VERSION}", font=("Segoe UI", 8),
-            fg=COLORS["text_muted"], bg=COLORS["bg_card"],
+            fg=_TEXT_MUTED, bg=_BG_CARD,
         ).pack(side="left", padx=(6, 0), pady=(2, 0))
 
-        # Quick-access icons (right-aligned, before hamburger)
-        gear_btn = tk.Label(
-            header, text="☰", font=("Segoe UI", 14),
-            fg=COLORS["text_secondary"], bg=COLORS["bg_card"],
-            cursor="hand2",
+        # Quick-access icons (right-aligned, hamburger last) — packed into
+        # one frame so the header only lays out a single right-side slave
+        icons = tk.Frame(header, bg=_BG_CARD)
+
+        # Pick locations shortcut
+        loc_btn = tk.Label(
+            icons, text="📍", font=("Segoe UI", 11),
+            fg=_TEXT_SECONDARY, bg=_BG_CARD,
+            cursor="hand2", padx=4,
         )
-        gear_btn.pack(side="right")
-        gear_btn.bind("<Button-1>", self._show_gear_menu)
-        self._add_hover(gear_btn, COLORS["text_primary"], COLORS["text_secondary"])
+        loc_btn.pack(side="left")
+        loc_btn.bind("<Button-1>", lambda e: self._on_pick_location())
+        self._add_hover(loc_btn, _ACCENT, _TEXT_SECONDARY)
 
         # Settings shortcut
         settings_btn = tk.Label(
-            header, text="⚙", font=("Segoe UI", 13),
-            fg=COLORS["text_secondary"], bg=COLORS["bg_card"],
+            icons, text="⚙", font=("Segoe UI", 13),
+            fg=_TEXT_SECONDARY, bg=_BG_CARD,
             cursor="hand2", padx=4,
         )
-        settings_btn.pack(side="right")
+        settings_btn.pack(side="left")
         settings_btn.bind("<Button-1>", lambda e: self._open_settings())
-        self._add_hover(settings_btn, COLORS["accent"], COLORS["text_secondary"])
+        self._add_hover(settings_btn, _ACCENT, _TEXT_SECONDARY)
 
-        # Pick locations shortcut
-        loc_btn = tk.Label(
-            header, text="📍", font=("Segoe UI", 11),
-            fg=COLORS["text_secondary"], bg=COLORS["bg_card"],
-            cursor="hand2", padx=4,
+        gear_btn = tk.Label(
+            icons, text="☰", font=("Segoe UI", 14),
+            fg=_TEXT_SECONDARY, bg=_BG_CARD,
+            cursor="hand2",
         )
-        loc_btn.pack(side="right")
-        loc_btn.bind("<Button-1>", lambda e: self._on_pick_location())
-        self._add_hover(loc_btn, COLORS["accent"], COLORS["text_secondary"])
+        gear_btn.pack(side="left")
+        gear_btn.bind("<Button-1>", self._show_gear_menu)
+        self._add_hover(gear_btn, _TEXT_PRIMARY, _TEXT_SECONDARY)
+
+        icons.pack(side="right")
 
         pad_x = 20  # horizontal padding inside the card
 
         # Thin separator
-        tk.Frame(card, bg=COLORS["border"], height=1).pack(fill="x", padx=pad_x, pady=(6, 0))
+        tk.Frame(card, bg=_BORDER, height=1).pack(fill="x", padx=pad_x, pady=(6, 0))
+
+        # Controls below the separator are built on the first idle tick so
+        # the window (status bar + Start button) is usable sooner
+        self._secondary = tk.Frame(card, bg=_BG_CARD)
+        self._secondary.pack(fill="x")
+        self.hotkey_badge = None
+        self.hotkey_display = None
+        self.root.after_idle(self._build_secondary_content)
+
+        # ── Status bar ────────────────────────────────────────
+        status_frame = tk.Frame(card, bg=_BG_MEDIUM)
+        status_frame.pack(fill="x", padx=pad_x, pady=(0, 14))
+
+        status_inner = tk.Frame(status_frame, bg=_BG_MEDIUM)
+        status_inner.pack(fill="x", padx=12, pady=8)
+
+        self.status_label = tk.Label(
+            status_inner, text="● Stopped", font=("Segoe UI", 9),
+            fg=_TEXT_MUTED, bg=_BG_MEDIUM, anchor="w",
+        )
+        self.status_label.pack(side="left")
+
+        self.count_label = tk.Label(
+            status_inner, text="Clicks: 0", font=("Segoe UI", 9),
+            fg=_TEXT_MUTED, bg=_BG_MEDIUM, anchor="e",
+        )
+        self.count_label.pack(side="right")
+
+        # ── Start Button ──────────────────────────────────────
+        self.start_btn = tk.Button(
+            card, text="▶ Start", font=("Segoe UI", 12, "bold"),
+            bg=_ACCENT, fg="white",
+            activebackground=_ACCENT_HOVER, activeforeground="white",
+            relief="flat", borderwidth=0, cursor="hand2",
+            pady=10, command=lambda: self._on_start_btn(),
+        )
+        self.start_btn.pack(fill="x", padx=pad_x, pady=(0, 20))
+
+        # Location indicator (below the card)
+        self.location_indicator = tk.Label(
+            self.root, text="Target: Cursor position",
+            font=("Segoe UI", 8), fg=_TEXT_MUTED,
+            bg=_BG_DARK, anchor="center",
+        )
+        self.location_indicator.pack(fill="x", padx=16, pady=(2, 8))
+
+    def _build_secondary_content(self):
+        """Interval, button/type, repeat/hotkey and start-delay sections."""
+        card = self._secondary
+        pad_x = 20  # horizontal padding inside the card
 
         # ── Click Interval ────────────────────────────────────
         self._make_section_label(card, "CLICK INTERVAL", pad_x, (16, 6))
 
-        interval_frame = tk.Frame(card, bg=COLORS["bg_card"])
+        interval_frame = tk.Frame(card, bg=_BG_CARD)
         interval_frame.pack(fill="x", padx=pad_x, pady=(0, 12))
 
         self._interval_entries: dict[str, tk.Entry] = {}
-        for i, (var, label, is_accent) in enumerate([
-            (self.hours_var, "HRS", False),
-            (self.mins_var, "MIN", False),
-            (self.secs_var, "SEC", False),
-            (self.ms_var, "MS", True),
+        plain = (_BORDER, _TEXT_PRIMARY)
+        accent = (_ACCENT_DIM, _ACCENT)
+        for i, (var, label, colors) in enumerate([
+            (self.hours_var, "HRS", plain),
+            (self.mins_var, "MIN", plain),
+            (self.secs_var, "SEC", plain),
+            (self.ms_var, "MS", accent),
         ]):
-            col = tk.Frame(interval_frame, bg=COLORS["bg_card"])
-            col.pack(side="left", expand=True, fill="x", padx=(0 if i == 0 else 6, 0))
-
-            border_color = COLORS["accent_dim"] if is_accent else COLORS["border"]
-            text_color = COLORS["accent"] if is_accent else COLORS["text_primary"]
-
-            entry_border = tk.Frame(col, bg=border_color, bd=0)
-            entry_border.pack(fill="x")
-
-            entry = tk.Entry(
-                entry_border, textvariable=var, font=("Segoe UI", 18, "bold"),
-                bg=COLORS["input_bg"], fg=text_color,
-                insertbackground=text_color, justify="center",
-                relief="flat", borderwidth=0, width=4,
+            self._interval_entries[label] = self._make_interval_column(
+                interval_frame, var, label, *colors, padx=(0 if i == 0 else 6, 0),
             )
-            entry.pack(padx=2, pady=2, fill="x", ipady=6)
-            self._interval_entries[label] = entry
-
-            tk.Label(
-                col, text=label, font=("Segoe UI", 7, "bold"),
-                fg=COLORS["text_muted"], bg=COLORS["bg_card"],
-            ).pack(pady=(3, 0))
 
         # ── Mouse Button + Click Type ─────────────────────────
-        row1 = tk.Frame(card, bg=COLORS["bg_card"])
+        row1 = tk.Frame(card, bg=_BG_CARD)
         row1.pack(fill="x", padx=pad_x, pady=(0, 12))
 
         # Mouse Button
-        btn_col = tk.Frame(row1, bg=COLORS["bg_card"])
+        btn_col = tk.Frame(row1, bg=_BG_CARD)
         btn_col.pack(side="left", expand=True, fill="x", padx=(0, 6))
         self._make_section_label(btn_col, "MOUSE BUTTON", 0, (0, 4))
         self._make_styled_combo(btn_col, self.button_var, MOUSE_BUTTONS)
 
         # Click Type
-        type_col = tk.Frame(row1, bg=COLORS["bg_card"])
+        type_col = tk.Frame(row1, bg=_BG_CARD)
         type_col.pack(side="left", expand=True, fill="x", padx=(6, 0))
         self._make_section_label(type_col, "CLICK TYPE", 0, (0, 4))
         self._make_styled_combo(type_col, self.type_var, CLICK_TYPES)
 
         # ── Repeat + Hotkey ───────────────────────────────────
-        row2 = tk.Frame(card, bg=COLORS["bg_card"])
+        row2 = tk.Frame(card, bg=_BG_CARD)
         row2.pack(fill="x", padx=pad_x, pady=(0, 14))
 
         # Repeat
-        rep_col = tk.Frame(row2, bg=COLORS["bg_card"])
+        rep_col = tk.Frame(row2, bg=_BG_CARD)
         rep_col.pack(side="left", expand=True, fill="x", padx=(0, 6))
         self._make_section_label(rep_col, "REPEAT", 0, (0, 4))
-        self._make_styled_combo(
+        repeat_combo = self._make_styled_combo(
             rep_col, self._repeat_display_var,
-            ["Until Stopped", "50 times", "100 times", "500 times", "Custom..."],
+            [*self._REPEAT_PRESETS, "Custom..."],
         )
+        # Fires once per user pick; programmatic sets (config load) don't
+        repeat_combo.bind("<<ComboboxSelected>>", self._on_repeat_display_changed)
 
         # Hotkey badge
-        hk_col = tk.Frame(row2, bg=COLORS["bg_card"])
+        hk_col = tk.Frame(row2, bg=_BG_CARD)
         hk_col.pack(side="left", expand=True, fill="x", padx=(6, 0))
         self._make_section_label(hk_col, "HOTKEY", 0, (0, 4))
 
-        hk_border = tk.Frame(hk_col, bg=COLORS["accent_dim"])
+        hk_border = tk.Frame(hk_col, bg=_ACCENT_DIM)
         hk_border.pack(fill="x")
 
         self.hotkey_badge = tk.Label(
             hk_border, text=self._hotkey_name, font=("Segoe UI", 13, "bold"),
-            fg=COLORS["accent"], bg=COLORS["input_bg"],
+            fg=_ACCENT, bg=_INPUT_BG,
             pady=6, cursor="hand2",
         )
         self.hotkey_badge.pack(fill="x", padx=1, pady=1)
         self.hotkey_badge.bind("<Button-1>", lambda e: self._on_set_hotkey())
 
         # ── Start Delay ───────────────────────────────────────
-        delay_row = tk.Frame(card, bg=COLORS["bg_card"])
+        delay_row = tk.Frame(card, bg=_BG_CARD)
         delay_row.pack(fill="x", padx=pad_x, pady=(0, 14))
 
         self._make_section_label(delay_row, "START DELAY", 0, (0, 4))
 
-        delay_inner = tk.Frame(delay_row, bg=COLORS["bg_card"])
+        delay_inner = tk.Frame(delay_row, bg=_BG_CARD)
         delay_inner.pack(fill="x")
 
-        delay_border = tk.Frame(delay_inner, bg=COLORS["border"])
+        delay_border = tk.Frame(delay_inner, bg=_BORDER)
         delay_border.pack(side="left")
 
         self.delay_spin = tk.Spinbox(
             delay_border, from_=0, to=60, width=4,
             textvariable=self.start_delay_var,
             font=("Segoe UI", 13, "bold"), justify="center",
-            bg=COLORS["input_bg"], fg=COLORS["text_primary"],
-            buttonbackground=COLORS["button_bg"],
-            insertbackground=COLORS["text_primary"],
+            bg=_INPUT_BG, fg=_TEXT_PRIMARY,
+            buttonbackground=_BUTTON_BG,
+            insertbackground=_TEXT_PRIMARY,
             relief="flat", borderwidth=0, highlightthickness=0,
+            validate="key", validatecommand=self._digits_vcmd,
         )
         self.delay_spin.pack(padx=2, pady=2)
 
         tk.Label(
             delay_inner, text="seconds", font=("Segoe UI", 9),
-            fg=COLORS["text_muted"], bg=COLORS["bg_card"],
+            fg=_TEXT_MUTED, bg=_BG_CARD,
         ).pack(side="left", padx=(8, 0))
 
-        # ── Status bar ────────────────────────────────────────
-        status_frame = tk.Frame(card, bg=COLORS["bg_medium"])
-        status_frame.pack(fill="x", padx=pad_x, pady=(0, 14))
-
-        status_inner = tk.Frame(status_frame, bg=COLORS["bg_medium"])
-        status_inner.pack(fill="x", padx=12, pady=8)
-
-        self.status_label = tk.Label(
-            status_inner, text="● Stopped", font=("Segoe UI", 9),
-            fg=COLORS["text_muted"], bg=COLORS["bg_medium"], anchor="w",
-        )
-        self.status_label.pack(side="left")
-
-        self.count_label = tk.Label(
-            status_inner, text="Clicks: 0", font=("Segoe UI", 9),
-            fg=COLORS["text_muted"], bg=COLORS["bg_medium"], anchor="e",
-        )
-        self.count_label.pack(side="right")
-
-        # ── Start Button ──────────────────────────────────────
-        self.start_btn = tk.Button(
-            card, text="▶ Start", font=("Segoe UI", 12, "bold"),
-            bg=COLORS["accent"], fg="white",
-            activebackground=COLORS["accent_hover"], activeforeground="white",
-            relief="flat", borderwidth=0, cursor="hand2",
-            pady=10, command=lambda: self._on_start_btn(),
-        )
-        self.start_btn.pack(fill="x", padx=pad_x, pady=(0, 20))
-
-        # Location indicator (below the card)
-        self.location_indicator = tk.Label(
-            self.root, text="Target: Cursor position",
-            font=("Segoe UI", 8), fg=COLORS["text_muted"],
-            bg=COLORS["bg_dark"], anchor="center",
-        )
-        self.location_indicator.pack(fill="x", padx=16, pady=(2, 8))
-
         # Hidden label kept for API compat (update_hotkey_display references it)
         self.hotkey_display = self.hotkey_badge
 
@@ -395,14 +501,33 @@ class SlickClickGUI:
 
     def _make_section_label(self, parent, text, padx, pady):
         """Small uppercase section label."""
-        lbl = tk.Label(
-            parent, text=text, font=("Segoe UI", 7, "bold"),
-            fg=COLORS["text_muted"], bg=COLORS["bg_card"],
-            anchor="w",
-        )
+        lbl = _SectionLabel(parent, text=text)
         lbl.pack(fill="x", padx=padx, pady=pady)
         return lbl
 
+    def _make_interval_column(self, parent, var, label, border_color, text_color, padx):
+        """Large centered interval entry with a small caption underneath."""
+        col = tk.Frame(parent, bg=_BG_CARD)
+        col.pack(side="left", expand=True, fill="x", padx=padx)
+
+        entry_border = tk.Frame(col, bg=border_color, bd=0)
+        entry_border.pack(fill="x")
+
+        entry = tk.Entry(
+            entry_border, textvariable=var, font=("Segoe UI", 18, "bold"),
+            bg=_INPUT_BG, fg=text_color,
+            insertbackground=text_color, justify="center",
+            relief="flat", borderwidth=0, width=4,
+            validate="key", validatecommand=self._digits_vcmd,
+        )
+        entry.pack(padx=2, pady=2, fill="x", ipady=6)
+
+        tk.Label(
+            col, text=label, font=("Segoe UI", 7, "bold"),
+            fg=_TEXT_MUTED, bg=_BG_CARD,
+        ).pack(pady=(3, 0))
+        return entry
+
     def _make_styled_combo(self, parent, var, values):
         """Styled dropdown matching the dark theme."""
         combo = ttk.Combobox(
@@ -416,49 +541,78 @@ class SlickClickGUI:
     @staticmethod
     def _add_hover(widget, hover_fg, normal_fg):
         """Add hover color effect to a widget."""
-        widget.bind("<Enter>", lambda e: widget.configure(fg=hover_fg))
-        widget.bind("<Leave>", lambda e: widget.configure(fg=normal_fg))
-
-    def _on_repeat_display_changed(self, *_args):
+        # Call Tcl directly — skips configure()'s Python-side option parsing
+        call, path = widget.tk.call, widget._w
+        widget.bind("<Enter>", lambda e: call(path, "configure", "-fg", hover_fg))
+        widget.bind("<Leave>", lambda e: call(path, "configure", "-fg", normal_fg))
+
+    def _on_interval_changed(self, key: str, var: tk.StringVar):
+        """Mirror an interval field into the Python-side cache.
+
+        Parsed in Python as base 10: an IntVar would go through Tcl, which
+        reads a leading zero as octal ("010" → 8, "09" → error).
+        """
+        text = var.get()
+        try:
+            self._interval_cache[key] = int(text, 10)
+        except ValueError:
+            # Field cleared mid-edit
+            self._interval_cache[key] = None
+
+    def _mirror_int(self, var: tk.StringVar, attr: str, empty: int):
+        """Copy a digits-only field into a plain int attribute."""
+        text = var.get()
+        setattr(self, attr, int(text) if text and _is_digits(text) else empty)
+
+    # Repeat combo entries → (repeat mode, repeat count)
+    _REPEAT_PRESETS = {
+        "Until Stopped": ("infinite", None),
+        "50 times": ("finite", "50"),
+        "100 times": ("finite", "100"),
+        "500 times": ("finite", "500"),
+    }
+
+    def _on_repeat_display_changed(self, event=None):
         """Sync the display combo to the internal repeat vars."""
         val = self._repeat_display_var.get()
-        if val == "Until Stopped":
-            self.repeat_mode.set("infinite")
-        elif val == "Custom...":
+        if val == "Custom...":
             self._open_repeat_options()
-        else:
-            # Parse "50 times" → 50
-            try:
-                count = int(val.split()[0])
-                self.repeat_mode.set("finite")
-                self.repeat_count_var.set(str(count))
-            except (ValueError, IndexError):
-                self.repeat_mode.set("infinite")
+            return
+        preset = self._REPEAT_PRESETS.get(val)
+        if preset is None:
+            # A non-preset count restored from config — vars are already set
+            return
+        mode, count = preset
+        self.repeat_mode.set(mode)
+        if count is not None:
+            self.repeat_count_var.set(count)
 
     # ------------------------------------------------------------------
     # Dialog: Clicking Options (Mouse button, click type, freeze pointer)
     # ------------------------------------------------------------------
 
     def _open_clicking_options(self):
-        dlg = self._make_dialog("Clicking options", 280, 200)
+        if self._reopen_dialog("clicking"):
+            return
+        dlg = self._make_dialog("Clicking options", 280, 200, cache_key="clicking")
 
-        body = tk.Frame(dlg, bg=COLORS["bg_card"])
+        body = tk.Frame(dlg, bg=_BG_CARD)
         body.pack(fill="both", expand=True, padx=16, pady=12)
 
         # Mouse button
-        row1 = tk.Frame(body, bg=COLORS["bg_card"])
+        row1 = tk.Frame(body, bg=_BG_CARD)
         row1.pack(fill="x", pady=(0, 8))
         tk.Label(row1, text="Mouse:", font=("Segoe UI", 10, "bold"),
-                 fg=COLORS["text_primary"], bg=COLORS["bg_card"]).pack(side="left", padx=(0, 10))
+                 fg=_TEXT_PRIMARY, bg=_BG_CARD).pack(side="left", padx=(0, 10))
         btn_combo = ttk.Combobox(row1, textvariable=self.button_var, values=MOUSE_BUTTONS,
                                   state="readonly", width=10)
         btn_combo.pack(side="left")
 
         # Click type
-        row2 = tk.Frame(body, bg=COLORS["bg_card"])
+        row2 = tk.Frame(body, bg=_BG_CARD)
         row2.pack(fill="x", pady=(0, 8))
         tk.Label(row2, text="Click:", font=("Segoe UI", 10, "bold"),
-                 fg=COLORS["text_primary"], bg=COLORS["bg_card"]).pack(side="left", padx=(0, 16))
+                 fg=_TEXT_PRIMARY, bg=_BG_CARD).pack(side="left", padx=(0, 16))
         type_combo = ttk.Combobox(row2, textvariable=self.type_var, values=CLICK_TYPES,
                                    state="readonly", width=10)
         type_combo.pack(side="left")
@@ -468,62 +622,65 @@ class SlickClickGUI:
             body, text="Freeze the pointer (only single click)",
             variable=self.freeze_var,
             font=("Segoe UI", 9),
-            fg=COLORS["text_secondary"], bg=COLORS["bg_card"],
-            selectcolor=COLORS["input_bg"],
-            activebackground=COLORS["bg_card"],
-            activeforeground=COLORS["text_secondary"],
+            fg=_TEXT_SECONDARY, bg=_BG_CARD,
+            selectcolor=_INPUT_BG,
+            activebackground=_BG_CARD,
+            activeforeground=_TEXT_SECONDARY,
         )
         freeze_cb.pack(anchor="w", pady=(4, 10))
 
         # OK / Cancel buttons
-        self._make_dialog_buttons(dlg, body, on_ok=lambda: dlg.destroy())
+        self._make_dialog_buttons(dlg, body)
 
     # ------------------------------------------------------------------
     # Dialog: Repeat / Interval settings
     # ------------------------------------------------------------------
 
     def _open_repeat_options(self):
-        dlg = self._make_dialog("Clicking repeat", 360, 230)
+        if self._reopen_dialog("repeat"):
+            return
+        dlg = self._make_dialog("Clicking repeat", 360, 230, cache_key="repeat")
 
-        body = tk.Frame(dlg, bg=COLORS["bg_card"])
+        body = tk.Frame(dlg, bg=_BG_CARD)
         body.pack(fill="both", expand=True, padx=16, pady=12)
 
         # Repeat N times
-        r1_frame = tk.Frame(body, bg=COLORS["bg_card"])
+        r1_frame = tk.Frame(body, bg=_BG_CARD)
         r1_frame.pack(fill="x", pady=(0, 4))
 
         tk.Radiobutton(
             r1_frame, text="Repeat", variable=self.repeat_mode, value="finite",
-            font=("Segoe UI", 10, "bold"), fg=COLORS["text_primary"], bg=COLORS["bg_card"],
-            selectcolor=COLORS["input_bg"], activebackground=COLORS["bg_card"],
-            activeforeground=COLORS["text_primary"],
+            font=("Segoe UI", 10, "bold"), fg=_TEXT_PRIMARY, bg=_BG_CARD,
+            selectcolor=_INPUT_BG, activebackground=_BG_CARD,
+            activeforeground=_TEXT_PRIMARY,
         ).pack(side="left")
 
         repeat_spin = tk.Spinbox(
             r1_frame, from_=1, to=999999, width=6, textvariable=self.repeat_count_var,
-            font=("Segoe UI", 10), bg=COLORS["input_bg"], fg=COLORS["text_primary"],
-            buttonbackground=COLORS["button_bg"], relief="solid", borderwidth=1,
+            font=("Segoe UI", 10), bg=_INPUT_BG, fg=_TEXT_PRIMARY,
+            buttonbackground=_BUTTON_BG, relief="solid", borderwidth=1,
             highlightthickness=0,
+            validate="key", validatecommand=self._digits_vcmd,
         )
         repeat_spin.pack(side="left", padx=6)
 
         tk.Label(r1_frame, text="times", font=("Segoe UI", 10),
-                 fg=COLORS["text_secondary"], bg=COLORS["bg_card"]).pack(side="left")
+                 fg=_TEXT_SECONDARY, bg=_BG_CARD).pack(side="left")
 
         # Repeat until stopped
         tk.Radiobutton(
             body, text="Repeat until stopped", variable=self.repeat_mode, value="infinite",
-            font=("Segoe UI", 10), fg=COLORS["text_primary"], bg=COLORS["bg_card"],
-            selectcolor=COLORS["input_bg"], activebackground=COLORS["bg_card"],
-            activeforeground=COLORS["text_primary"],
+            font=("Segoe UI", 10), fg=_TEXT_PRIMARY, bg=_BG_CARD,
+            selectcolor=_INPUT_BG, activebackground=_BG_CARD,
+            activeforeground=_TEXT_PRIMARY,
         ).pack(anchor="w", pady=(0, 12))
 
         # Interval row
-        interval_frame = tk.Frame(body, bg=COLORS["bg_card"])
+        interval_frame = tk.Frame(body, bg=_BG_CARD)
         interval_frame.pack(fill="x", pady=(0, 10))
 
         tk.Label(interval_frame, text="Interval:", font=("Segoe UI", 10, "bold"),
-                 fg=COLORS["text_primary"], bg=COLORS["bg_card"]).pack(side="left", padx=(0, 8))
+                 fg=_TEXT_PRIMARY, bg=_BG_CARD).pack(side="left", padx=(0, 8))
 
         for var, label, width in [
             (self.hours_var, "hours", 3),
@@ -534,91 +691,104 @@ class SlickClickGUI:
             spin = tk.Spinbox(
                 interval_frame, from_=0, to=999 if label == "milliseconds" else 59,
                 width=width, textvariable=var, font=("Segoe UI", 10),
-                bg=COLORS["input_bg"], fg=COLORS["text_primary"],
-                buttonbackground=COLORS["button_bg"], relief="solid", borderwidth=1,
+                bg=_INPUT_BG, fg=_TEXT_PRIMARY,
+                buttonbackground=_BUTTON_BG, relief="solid", borderwidth=1,
                 highlightthickness=0,
+                validate="key", validatecommand=self._digits_vcmd,
             )
             spin.pack(side="left", padx=(0, 2))
             tk.Label(interval_frame, text=label, font=("Segoe UI", 8),
-                     fg=COLORS["text_muted"], bg=COLORS["bg_card"]).pack(side="left", padx=(0, 6))
+                     fg=_TEXT_MUTED, bg=_BG_CARD).pack(side="left", padx=(0, 6))
 
         # OK / Cancel
-        self._make_dialog_buttons(dlg, body, on_ok=lambda: dlg.destroy())
+        self._make_dialog_buttons(dlg, body)
 
     # ------------------------------------------------------------------
     # Dialog: Settings (Hotkey configuration)
     # ------------------------------------------------------------------
 
     def _open_settings(self):
-        dlg = self._make_dialog("Settings", 300, 240)
+        if self._reopen_dialog("settings"):
+            # Refresh the values that may have changed while it was hidden
+            self._settings_hotkey_label.configure(text=self._hotkey_name)
+            self._fixed_radio.configure(text=f"Fixed ({len(self._locations)})")
+            return
+        dlg = self._make_dialog("Settings", 300, 240, cache_key="settings")
+
+        # Closing only hides this dialog, so a capture bound to it would
+        # outlive it and swallow keys on reopen — end it with the dialog
+        hide = dlg._close
 
-        body = tk.Frame(dlg, bg=COLORS["bg_card"])
+        def _close_settings():
+            self._on_cancel_hotkey()
+            hide()
+        dlg._close = _close_settings
+
+        body = tk.Frame(dlg, bg=_BG_CARD)
         body.pack(fill="both", expand=True, padx=16, pady=12)
 
         # Current hotkey
-        row = tk.Frame(body, bg=COLORS["bg_card"])
+        row = tk.Frame(body, bg=_BG_CARD)
         row.pack(fill="x", pady=(0, 8))
 
         tk.Label(row, text="Hotkey:", font=("Segoe UI", 10, "bold"),
-                 fg=COLORS["text_primary"], bg=COLORS["bg_card"]).pack(side="left", padx=(0, 10))
+                 fg=_TEXT_PRIMARY, bg=_BG_CARD).pack(side="left", padx=(0, 10))
 
         self._settings_hotkey_label = tk.Label(
             row, text=self._hotkey_name, font=("Segoe UI", 12, "bold"),
-            fg=COLORS["accent"], bg=COLORS["bg_card"],
+            fg=_ACCENT, bg=_BG_CARD,
         )
         self._settings_hotkey_label.pack(side="left", padx=(0, 10))
 
         self._set_hotkey_btn = tk.Button(
             row, text="Change...", command=lambda: self._on_set_hotkey(dlg),
-            font=("Segoe UI", 9), bg=COLORS["button_bg"], fg=COLORS["text_primary"],
-            activebackground=COLORS["button_hover"], activeforeground=COLORS["text_primary"],
+            font=("Segoe UI", 9), bg=_BUTTON_BG, fg=_TEXT_PRIMARY,
+            activebackground=_BUTTON_HOVER, activeforeground=_TEXT_PRIMARY,
             relief="flat", borderwidth=0, padx=10, pady=3,
         )
         self._set_hotkey_btn.pack(side="left")
 
         # Target mode
-        target_frame = tk.Frame(body, bg=COLORS["bg_card"])
+        target_frame = tk.Frame(body, bg=_BG_CARD)
         target_frame.pack(fill="x", pady=(4, 10))
 
         tk.Label(target_frame, text="Click at:", font=("Segoe UI", 10, "bold"),
-                 fg=COLORS["text_primary"], bg=COLORS["bg_card"]).pack(side="left", padx=(0, 10))
+                 fg=_TEXT_PRIMARY, bg=_BG_CARD).pack(side="left", padx=(0, 10))
 
         tk.Radiobutton(
             target_frame, text="Cursor", variable=self.target_mode, value="cursor",
-            font=("Segoe UI", 9), fg=COLORS["text_secondary"], bg=COLORS["bg_card"],
-            selectcolor=COLORS["input_bg"], activebackground=COLORS["bg_card"],
+            font=("Segoe UI", 9), fg=_TEXT_SECONDARY, bg=_BG_CARD,
+            selectcolor=_INPUT_BG, activebackground=_BG_CARD,
         ).pack(side="left", padx=(0, 6))
 
-        locs_text = f"Fixed ({len(self._locations)})"
-        self._fixed_radio_text = tk.StringVar(value=locs_text)
-
-        tk.Radiobutton(
-            target_frame, textvariable=self._fixed_radio_text,
+        self._fixed_radio = tk.Radiobutton(
+            target_frame, text=f"Fixed ({len(self._locations)})",
             variable=self.target_mode, value="fixed",
-            font=("Segoe UI", 9), fg=COLORS["text_secondary"], bg=COLORS["bg_card"],
-            selectcolor=COLORS["input_bg"], activebackground=COLORS["bg_card"],
-        ).pack(side="left")
+            font=("Segoe UI", 9), fg=_TEXT_SECONDARY, bg=_BG_CARD,
+            selectcolor=_INPUT_BG, activebackground=_BG_CARD,
+        )
+        self._fixed_radio.pack(side="left")
 
         # Notification toggles
-        notif_frame = tk.Frame(body, bg=COLORS["bg_card"])
+        notif_frame = tk.Frame(body, bg=_BG_CARD)
         notif_frame.pack(fill="x", pady=(4, 4))
 
         tk.Checkbutton(
             notif_frame, text="Show toast notifications",
             variable=self.show_toast,
-            font=("Segoe UI", 9), fg=COLORS["text_secondary"], bg=COLORS["bg_card"],
-            selectcolor=COLORS["input_bg"], activebackground=COLORS["bg_card"],
+            font=("Segoe UI", 9), fg=_TEXT_SECONDARY, bg=_BG_CARD,
+            selectcolor=_INPUT_BG, activebackground=_BG_CARD,
         ).pack(anchor="w")
 
         tk.Checkbutton(
             notif_frame, text="Show on-screen indicator",
             variable=self.show_osd,
-            font=("Segoe UI", 9), fg=COLORS["text_secondary"], bg=COLORS["bg_card"],
-            selectcolor=COLORS["input_bg"], activebackground=COLORS["bg_card"],
+            font=("Segoe UI", 9), fg=_TEXT_SECONDARY, bg=_BG_CARD,
+            selectcolor=_INPUT_BG, activebackground=_BG_CARD,
         ).pack(anchor="w")
 
         # OK / Cancel
-        self._make_dialog_buttons(dlg, body, on_ok=lambda: dlg.destroy())
+        self._make_dialog_buttons(dlg, body)
 
     # ------------------------------------------------------------------
     # Help / Guide dialog
@@ -627,13 +797,13 @@ class SlickClickGUI:
     def _show_help(self):
         dlg = self._make_dialog("Help — User Guide", 400, 420)
 
-        body = tk.Frame(dlg, bg=COLORS["bg_card"])
+        body = tk.Frame(dlg, bg=_BG_CARD)
         body.pack(fill="both", expand=True, padx=0, pady=0)
 
         # Scrollable canvas
-        canvas = tk.Canvas(body, bg=COLORS["bg_card"], highlightthickness=0)
+        canvas = tk.Canvas(body, bg=_BG_CARD, highlightthickness=0)
         scrollbar = tk.Scrollbar(body, orient="vertical", command=canvas.yview)
-        scroll_frame = tk.Frame(canvas, bg=COLORS["bg_card"])
+        scroll_frame = tk.Frame(canvas, bg=_BG_CARD)
 
         scroll_frame.bind(
             "<Configure>",
@@ -653,12 +823,12 @@ class SlickClickGUI:
         # Helper to add sections
         def section(title):
             tk.Label(scroll_frame, text=title, font=("Segoe UI", 11, "bold"),
-                     fg=COLORS["accent"], bg=COLORS["bg_card"],
+                     fg=_ACCENT, bg=_BG_CARD,
                      anchor="w").pack(fill="x", pady=(12, 2), padx=8)
 
         def text(content):
             tk.Label(scroll_frame, text=content, font=("Segoe UI", 9),
-                     fg=COLORS["text_secondary"], bg=COLORS["bg_card"],
+                     fg=_TEXT_SECONDARY, bg=_BG_CARD,
                      anchor="w", justify="left", wraplength=350).pack(fill="x", padx=16, pady=(0, 4))
 
         # Content
@@ -710,8 +880,8 @@ class SlickClickGUI:
         # Close button
         tk.Button(
             scroll_frame, text="Close", command=lambda: (canvas.unbind_all("<MouseWheel>"), dlg.destroy()),
-            font=("Segoe UI", 9), bg=COLORS["button_bg"], fg=COLORS["text_primary"],
-            activebackground=COLORS["button_hover"], relief="flat", padx=20, pady=3,
+            font=("Segoe UI", 9), bg=_BUTTON_BG, fg=_TEXT_PRIMARY,
+            activebackground=_BUTTON_HOVER, relief="flat", padx=20, pady=3,
         ).pack(pady=(12, 16))
 
     # ------------------------------------------------------------------
@@ -722,25 +892,27 @@ class SlickClickGUI:
         import webbrowser
         from .updater import check_for_updates
 
-        dlg = self._make_dialog("About SlickClick", 280, 200)
+        if self._reopen_dialog("about"):
+            return
+        dlg = self._make_dialog("About SlickClick", 280, 200, cache_key="about")
 
-        body = tk.Frame(dlg, bg=COLORS["bg_card"])
+        body = tk.Frame(dlg, bg=_BG_CARD)
         body.pack(fill="both", expand=True, padx=16, pady=16)
 
         tk.Label(body, text=f"⚡ {APP_NAME}", font=("Segoe UI", 14, "bold"),
-                 fg=COLORS["accent"], bg=COLORS["bg_card"]).pack(pady=(0, 4))
+                 fg=_ACCENT, bg=_BG_CARD).pack(pady=(0, 4))
         tk.Label(body, text=f"Version {APP_VERSION}", font=("Segoe UI", 10),
-                 fg=COLORS["text_secondary"], bg=COLORS["bg_card"]).pack()
+                 fg=_TEXT_SECONDARY, bg=_BG_CARD).pack()
         tk.Label(body, text="Automatic Mouse Clicker", font=("Segoe UI", 9),
-                 fg=COLORS["text_muted"], bg=COLORS["bg_card"]).pack(pady=(4, 0))
+                 fg=_TEXT_MUTED, bg=_BG_CARD).pack(pady=(4, 0))
 
         # Update check area
-        update_frame = tk.Frame(body, bg=COLORS["bg_card"])
+        update_frame = tk.Frame(body, bg=_BG_CARD)
         update_frame.pack(fill="x", pady=(10, 0))
 
         update_label = tk.Label(
             update_frame, text="", font=("Segoe UI", 9),
-            fg=COLORS["text_muted"], bg=COLORS["bg_card"],
+            fg=_TEXT_MUTED, bg=_BG_CARD,
         )
 
         def _on_result(result):
@@ -749,21 +921,21 @@ class SlickClickGUI:
                     return
                 check_btn.configure(state="normal", text="Check for Updates")
                 if result.get("up_to_date"):
-                    update_label.configure(text="✓ You're up to date!", fg=COLORS["success"])
+                    update_label.configure(text="✓ You're up to date!", fg=_SUCCESS)
                     update_label.pack(pady=(4, 0))
                 elif result.get("latest"):
                     ver = result["latest"]
                     url = result.get("url", "")
                     update_label.configure(
                         text=f"⬆ v{ver} available — click to download",
-                        fg=COLORS["accent"], cursor="hand2",
+                        fg=_ACCENT, cursor="hand2",
                     )
                     update_label.pack(pady=(4, 0))
                     if url:
-                        update_label.bind("<Button-1>", lambda e: (webbrowser.open(url), dlg.destroy()))
+                        update_label.bind("<Button-1>", lambda e: (webbrowser.open(url), dlg._close()))
                 else:
                     update_label.configure(
-                        text="Could not check for updates", fg=COLORS["warning"],
+                        text="Could not check for updates", fg=_WARNING,
                     )
                     update_label.pack(pady=(4, 0))
             self.root.after(0, _apply)
@@ -775,57 +947,64 @@ class SlickClickGUI:
 
         check_btn = tk.Button(
             update_frame, text="Check for Updates", command=_check,
-            font=("Segoe UI", 9), bg=COLORS["button_bg"], fg=COLORS["text_primary"],
-            activebackground=COLORS["button_hover"], activeforeground=COLORS["text_primary"],
+            font=("Segoe UI", 9), bg=_BUTTON_BG, fg=_TEXT_PRIMARY,
+            activebackground=_BUTTON_HOVER, activeforeground=_TEXT_PRIMARY,
             relief="flat", borderwidth=0, padx=12, pady=3,
         )
         check_btn.pack()
 
         tk.Button(
-            body, text="OK", command=dlg.destroy,
-            font=("Segoe UI", 9), bg=COLORS["button_bg"], fg=COLORS["text_primary"],
-            activebackground=COLORS["button_hover"], relief="flat", padx=20, pady=3,
+            body, text="OK", command=dlg._close,
+            font=("Segoe UI", 9), bg=_BUTTON_BG, fg=_TEXT_PRIMARY,
+            activebackground=_BUTTON_HOVER, relief="flat", padx=20, pady=3,
         ).pack(pady=(10, 0))
 
     # ------------------------------------------------------------------
     # Dialog helpers
     # ------------------------------------------------------------------
 
-    def _make_dialog(self, title: str, width: int, height: int) -> tk.Toplevel:
+    def _make_dialog(self, title: str, width: int, height: int,
+                     cache_key: str | None = None) -> tk.Toplevel:
+        """Build a banner-styled dialog.
+
+        When *cache_key* is given, closing only withdraws the dialog and it
+        is kept for ``_reopen_dialog`` to show again without rebuilding.
+        """
         dlg = tk.Toplevel(self.root)
         dlg.overrideredirect(True)
         dlg.attributes("-topmost", True)
-        dlg.configure(bg=COLORS["bg_card"])
+        dlg.configure(bg=_BG_CARD)
         dlg.transient(self.root)
         dlg.lift()
         dlg.focus_force()
 
         # Total height includes the 28px banner
-        total_h = height + 28
+        dlg._size = (width, height + 28)
+        self._center_dialog(dlg)
 
-        # Center on parent
-        dlg.update_idletasks()
-        x = self.root.winfo_x() + (self.root.winfo_width() - width) // 2
-        y = self.root.winfo_y() + (self.root.winfo_height() - total_h) // 2
-        dlg.geometry(f"{width}x{total_h}+{x}+{y}")
+        if cache_key is None:
+            dlg._close = dlg.destroy
+        else:
+            dlg._close = dlg.withdraw
+            self._dlg_cache[cache_key] = dlg
 
         # Accent banner title bar (matches Pick Locations style)
-        title_bar = tk.Frame(dlg, bg=COLORS["accent"], height=28)
+        title_bar = tk.Frame(dlg, bg=_ACCENT, height=28)
         title_bar.pack(fill="x")
         title_bar.pack_propagate(False)
 
         title_lbl = tk.Label(
             title_bar, text=f"⚡ {title}", font=("Segoe UI", 10, "bold"),
-            fg="white", bg=COLORS["accent"],
+            fg="white", bg=_ACCENT,
         )
         title_lbl.pack(side="left", padx=8)
 
         close_btn = tk.Label(
             title_bar, text="✕", font=("Segoe UI", 10, "bold"),
-            fg="white", bg=COLORS["accent"], cursor="hand2", padx=8,
+            fg="white", bg=_ACCENT, cursor="hand2", padx=8,
         )
         close_btn.pack(side="right")
-        close_btn.bind("<Button-1>", lambda e: dlg.destroy())
+        close_btn.bind("<Button-1>", lambda e: dlg._close())
 
         # Make title bar draggable
         def _start_drag(event):
@@ -844,50 +1023,57 @@ class SlickClickGUI:
 
         return dlg
 
+    def _center_dialog(self, dlg: tk.Toplevel):
+        """Center a dialog over the main window."""
+        width, total_h = dlg._size
+        x = self.root.winfo_x() + (self.root.winfo_width() - width) // 2
+        y = self.root.winfo_y() + (self.root.winfo_height() - total_h) // 2
+        dlg.geometry(f"{width}x{total_h}+{x}+{y}")
+
+    def _reopen_dialog(self, cache_key: str) -> tk.Toplevel | None:
+        """Re-show a cached dialog; returns None if it needs building."""
+        dlg = self._dlg_cache.get(cache_key)
+        if dlg is None or not dlg.winfo_exists():
+            return None
+        self._center_dialog(dlg)
+        dlg.deiconify()
+        dlg.lift()
+        dlg.focus_force()
+        return dlg
+
     def _make_dialog_buttons(self, dlg, parent, on_ok=None):
-        btn_frame = tk.Frame(parent, bg=COLORS["bg_card"])
+        btn_frame = tk.Frame(parent, bg=_BG_CARD)
         btn_frame.pack(fill="x", pady=(6, 0))
 
-        tk.Button(
-            btn_frame, text="Ok", command=on_ok or dlg.destroy,
-            font=("Segoe UI", 9), bg=COLORS["button_bg"], fg=COLORS["text_primary"],
-            activebackground=COLORS["button_hover"], activeforeground=COLORS["text_primary"],
-            relief="flat", borderwidth=0, padx=16, pady=3,
-        ).pack(side="left", padx=(0, 8))
-
-        tk.Button(
-            btn_frame, text="Cancel", command=dlg.destroy,
-            font=("Segoe UI", 9), bg=COLORS["button_bg"], fg=COLORS["text_primary"],
-            activebackground=COLORS["button_hover"], activeforeground=COLORS["text_primary"],
-            relief="flat", borderwidth=0, padx=16, pady=3,
-        ).pack(side="left")
+        _DialogButton(btn_frame, text="Ok", command=on_ok or dlg._close).pack(
+            side="left", padx=(0, 8))
+        _DialogButton(btn_frame, text="Cancel", command=dlg._close).pack(side="left")
 
     # ------------------------------------------------------------------
     # Value getters (used by main.py)
     # ------------------------------------------------------------------
 
     def get_interval_ms(self) -> int:
-        try:
-            h = int(self.hours_var.get())
-            m = int(self.mins_var.get())
-            s = int(self.secs_var.get())
-            ms = int(self.ms_var.get())
-            return (h * 3600 + m * 60 + s) * 1000 + ms
-        except ValueError:
+        c = self._interval_cache
+        h, m, s, ms = c["h"], c["m"], c["s"], c["ms"]
+        if h is None or m is None or s is None or ms is None:
             return DEFAULT_INTERVAL_MS
+        return (h * 3600 + m * 60 + s) * 1000 + ms
 
     def get_repeat_count(self) -> int:
         if self.repeat_mode.get() == "infinite":
             return 0
-        try:
-            return max(1, int(self.repeat_count_var.get()))
-        except ValueError:
-            return 10
+        return max(1, self._repeat_count)
 
-    def get_locations(self) -> list[tuple[int, int]]:
+    def get_locations(self) -> Sequence[tuple[int, int]]:
+        """Saved targets, or an empty sequence in cursor mode.
+
+        Returns the live list without copying — treat it as read-only.
+        ClickerEngine.start() packs it into its own buffer anyway.
+        """
         if self.target_mode.get() == "cursor":
-            return []
-        return list(self._locations)
+            return ()
+        return self._locations
 
     def get_mouse_button(self) -> str:
         return self.button_var.get()
@@ -896,10 +1082,7 @@ class SlickClickGUI:
         return self.type_var.get()
 
     def get_start_delay_secs(self) -> int:
-        try:
-            return max(0, int(self.start_delay_var.get()))
-        except ValueError:
-            return 0
+        return self._start_delay
 
     # ------------------------------------------------------------------
     # Location management
@@ -914,48 +1097,76 @@ class SlickClickGUI:
         """Remove a location by index."""
         if 0 <= index < len(self._locations):
             self._locations.pop(index)
+            del self._location_labels[index:]
             self._update_location_indicator()
 
+    def _get_location_labels(self) -> list[str]:
+        """Return the viewer row text for every location, formatting only new ones."""
+        labels = self._location_labels
+        locations = self._locations
+        for i in range(len(labels), len(locations)):
+            x, y = locations[i]
+            labels.append(f"  #{i + 1}:  ({x}, {y})")
+        return labels
+
     def _update_location_indicator(self):
+        """Schedule a refresh of the location label, coalescing bursts."""
+        if self._loc_indicator_pending:
+            return
+        self._loc_indicator_pending = True
+        self.root.after_idle(self._flush_location_indicator)
+
+    _CURSOR_TARGET_STYLE = MappingProxyType({
+        "text": "Target: Cursor position", "fg": _TEXT_MUTED,
+    })
+
+    def _flush_location_indicator(self):
         """Update the location count label in the main window."""
+        self._loc_indicator_pending = False
         count = len(self._locations)
         if count == 0 or self.target_mode.get() == "cursor":
-            self.location_indicator.configure(
-                text="Target: Cursor position",
-                fg=COLORS["text_muted"],
-            )
+            self.location_indicator.configure(**self._CURSOR_TARGET_STYLE)
         else:
             self.location_indicator.configure(
                 text=f"Target: {count} fixed location{'s' if count != 1 else ''}  ●",
-                fg=COLORS["accent"],
+                fg=_ACCENT,
             )
 
     # ------------------------------------------------------------------
     # Status updates (called thread-safe via root.after)
     # ------------------------------------------------------------------
 
+    # running → (status label options, start button options)
+    _STATUS_STYLES = MappingProxyType({
+        True: (
+            MappingProxyType({"text": "● Running", "fg": _SUCCESS}),
+            MappingProxyType({"text": "■ Stop", "bg": _SUCCESS,
+                              "activebackground": "#27ae60"}),
+        ),
+        False: (
+            MappingProxyType({"text": "● Stopped", "fg": _TEXT_MUTED}),
+            MappingProxyType({"text": "▶ Start", "bg": _ACCENT,
+                              "activebackground": _ACCENT_HOVER}),
+        ),
+    })
+
     def update_status(self, running: bool):
-        if running:
-            self.status_label.configure(text="● Running", fg=COLORS["success"])
-            self.start_btn.configure(
-                text="■ Stop",
-                bg=COLORS["success"],
-                activebackground="#27ae60",
-            )
-        else:
-            self.status_label.configure(text="● Stopped", fg=COLORS["text_muted"])
-            self.start_btn.configure(
-                text="▶ Start",
-                bg=COLORS["accent"],
-                activebackground=COLORS["accent_hover"],
-            )
+        label_opts, button_opts = self._STATUS_STYLES[running]
+        self.status_label.configure(**label_opts)
+        self.start_btn.configure(**button_opts)
 
     def update_click_count(self, count: int):
+        # Polled while clicking; skip repaints of an unchanged value
+        if count == self._last_count:
+            return
+        self._last_count = count
         self.count_label.configure(text=f"Clicks: {count:,}")
 
     def update_hotkey_display(self, key_name: str):
         self._hotkey_name = key_name
-        self.hotkey_badge.configure(text=key_name)
+        # The badge is built on the first idle tick and picks up the name then
+        if self.hotkey_badge is not None:
+            self.hotkey_badge.configure(text=key_name)
 
     # ------------------------------------------------------------------
     # Stub callbacks (overridden by main.py)
@@ -972,11 +1183,15 @@ class SlickClickGUI:
 
     def _on_clear_locations(self):
         self._locations.clear()
+        self._location_labels.clear()
         self._update_location_indicator()
 
     def _on_set_hotkey(self, dlg=None):
         pass
 
+    def _on_cancel_hotkey(self):
+        pass
+
     def _on_close(self):
         pass
 
@@ -990,25 +1205,25 @@ class SlickClickGUI:
         height = min(350, 120 + count * 24)
         dlg = self._make_dialog(f"Saved Locations ({count})", 320, max(160, height))
 
-        body = tk.Frame(dlg, bg=COLORS["bg_card"])
+        body = tk.Frame(dlg, bg=_BG_CARD)
         body.pack(fill="both", expand=True, padx=16, pady=12)
 
         if count == 0:
             tk.Label(
                 body, text="No locations saved.\n\nUse Options → Recording → Pick Locations\nto add click targets.",
-                font=("Segoe UI", 10), fg=COLORS["text_muted"], bg=COLORS["bg_card"],
+                font=("Segoe UI", 10), fg=_TEXT_MUTED, bg=_BG_CARD,
                 justify="center",
             ).pack(expand=True)
         else:
             # Scrollable list
-            list_frame = tk.Frame(body, bg=COLORS["bg_card"])
+            list_frame = tk.Frame(body, bg=_BG_CARD)
             list_frame.pack(fill="both", expand=True)
 
             listbox = tk.Listbox(
                 list_frame, height=min(10, count),
-                bg=COLORS["listbox_bg"], fg=COLORS["text_primary"],
-                selectbackground=COLORS["listbox_select"],
-                selectforeground=COLORS["text_primary"],
+                bg=_LISTBOX_BG, fg=_TEXT_PRIMARY,
+                selectbackground=_LISTBOX_SELECT,
+                selectforeground=_TEXT_PRIMARY,
                 font=("Consolas", 10), borderwidth=1, relief="solid",
                 highlightthickness=0,
             )
@@ -1016,37 +1231,46 @@ class SlickClickGUI:
 
             scrollbar = tk.Scrollbar(list_frame, orient="vertical", command=listbox.yview)
             scrollbar.pack(side="right", fill="y")
-            listbox.config(yscrollcommand=scrollbar.set)
 
-            for i, (x, y) in enumerate(self._locations):
-                listbox.insert("end", f"  #{i + 1}:  ({x}, {y})")
+            # One Tcl call for the whole list instead of one per row
+            listbox.insert("end", *self._get_location_labels())
+            # Hook up the scrollbar only once the rows are in, so its
+            # extent is computed a single time
+            listbox.config(yscrollcommand=scrollbar.set)
 
             # Remove button
-            btn_frame = tk.Frame(body, bg=COLORS["bg_card"])
+            btn_frame = tk.Frame(body, bg=_BG_CARD)
             btn_frame.pack(fill="x", pady=(8, 0))
 
             def remove_selected():
                 sel = listbox.curselection()
                 if sel:
                     idx = sel[0]
-                    self.remove_location(idx)
+                    del self._locations[idx]
+                    del self._location_labels[idx:]
+                    self._update_location_indicator()
                     listbox.delete(idx)
-                    dlg.title(f"Saved Locations ({len(self._locations)})")
+                    remaining = len(self._locations)
+                    dlg.title(f"Saved Locations ({remaining})")
+                    # Keep the selection on the next row so repeated
+                    # removals don't need a fresh click each time
+                    if remaining:
+                        listbox.selection_set(min(idx, remaining - 1))
 
             tk.Button(
                 btn_frame, text="Remove Selected", command=remove_selected,
-                font=("Segoe UI", 9), bg=COLORS["button_bg"], fg=COLORS["text_primary"],
-                activebackground=COLORS["button_hover"], relief="flat", padx=10, pady=3,
+                font=("Segoe UI", 9), bg=_BUTTON_BG, fg=_TEXT_PRIMARY,
+                activebackground=_BUTTON_HOVER, relief="flat", padx=10, pady=3,
             ).pack(side="left", padx=(0, 8))
 
             tk.Button(
                 btn_frame, text="Dry Run Preview", command=lambda: (dlg.destroy(), self._on_dry_run()),
-                font=("Segoe UI", 9), bg=COLORS["accent_dim"], fg="white",
-                activebackground=COLORS["accent"], relief="flat", padx=10, pady=3,
+                font=("Segoe UI", 9), bg=_ACCENT_DIM, fg="white",
+                activebackground=_ACCENT, relief="flat", padx=10, pady=3,
             ).pack(side="left")
 
         tk.Button(
             body, text="Close", command=dlg.destroy,
-            font=("Segoe UI", 9), bg=COLORS["button_bg"], fg=COLORS["text_primary"],
-            activebackground=COLORS["button_hover"], relief="flat", padx=16, pady=3,
+            font=("Segoe UI", 9), bg=_BUTTON_BG, fg=_TEXT_PRIMARY,
+            activebackground=_BUTTON_HOVER, relief="flat", padx=16, pady=3,
         ).pack(pady=(8, 0))
@@ -7,65 +7,70 @@ more reliable than pynput in PyInstaller-packaged executables.
 
 import ctypes
 import ctypes.wintypes as wintypes
+import functools
 import threading
 import time
+from types import MappingProxyType
 
 from .logging_config import logger
 from .constants import DEFAULT_HOTKEY
 
-user32 = ctypes.windll.user32
+# use_last_error so ctypes.get_last_error() reports the failing call's code
+user32 = ctypes.WinDLL("user32", use_last_error=True)
+kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+# Declared prototypes: 64-bit handles survive the call and ctypes skips
+# per-call argument inference in the message pump
+kernel32.CreateEventW.restype = wintypes.HANDLE
+kernel32.SetEvent.argtypes = [wintypes.HANDLE]
+kernel32.ResetEvent.argtypes = [wintypes.HANDLE]
+user32.RegisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT]
+user32.RegisterHotKey.restype = wintypes.BOOL
+user32.UnregisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int]
+user32.UnregisterHotKey.restype = wintypes.BOOL
+user32.PeekMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND,
+                                wintypes.UINT, wintypes.UINT, wintypes.UINT]
+user32.PeekMessageW.restype = wintypes.BOOL
+user32.MsgWaitForMultipleObjectsEx.argtypes = [
+    wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE),
+    wintypes.DWORD, wintypes.DWORD, wintypes.DWORD,
+]
+user32.MsgWaitForMultipleObjectsEx.restype = wintypes.DWORD
 
 WM_HOTKEY = 0x0312
 _HOTKEY_ID = 1
 
+PM_REMOVE = 0x0001
+INFINITE = 0xFFFFFFFF
+WAIT_OBJECT_0 = 0
+QS_ALLINPUT = 0x04FF
+MWMO_INPUTAVAILABLE = 0x0004
+
 # ── Virtual-key code table ────────────────────────────────────────────
-_VK_MAP: dict[str, int] = {}
-
-def _build_vk_map():
-    m: dict[str, int] = {}
-    # Function keys F1–F24
-    for i in range(1, 25):
-        m[f"F{i}"] = 0x6F + i          # VK_F1 = 0x70
-    # Letters A–Z
-    for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-        m[c] = ord(c)                   # VK_A = 0x41
-    # Digits 0–9
-    for c in "0123456789":
-        m[c] = ord(c)                   # VK_0 = 0x30
+# Spelled out as a literal so nothing is built at import time
+_VK_MAP = MappingProxyType({
+    # Function keys F1–F24 (VK_F1 = 0x70)
+    "F1": 0x70, "F2": 0x71, "F3": 0x72, "F4": 0x73, "F5": 0x74, "F6": 0x75,
+    "F7": 0x76, "F8": 0x77, "F9": 0x78, "F10": 0x79, "F11": 0x7A, "F12": 0x7B,
+    "F13": 0x7C, "F14": 0x7D, "F15": 0x7E, "F16": 0x7F, "F17": 0x80, "F18": 0x81,
+    "F19": 0x82, "F20": 0x83, "F21": 0x84, "F22": 0x85, "F23": 0x86, "F24": 0x87,
+    # Letters A–Z (VK_A = 0x41)
+    "A": 0x41, "B": 0x42, "C": 0x43, "D": 0x44, "E": 0x45, "F": 0x46, "G": 0x47,
+    "H": 0x48, "I": 0x49, "J": 0x4A, "K": 0x4B, "L": 0x4C, "M": 0x4D, "N": 0x4E,
+    "O": 0x4F, "P": 0x50, "Q": 0x51, "R": 0x52, "S": 0x53, "T": 0x54, "U": 0x55,
+    "V": 0x56, "W": 0x57, "X": 0x58, "Y": 0x59, "Z": 0x5A,
+    # Digits 0–9 (VK_0 = 0x30)
+    "0": 0x30, "1": 0x31, "2": 0x32, "3": 0x33, "4": 0x34,
+    "5": 0x35, "6": 0x36, "7": 0x37, "8": 0x38, "9": 0x39,
     # Special keys (common hotkey candidates)
-    m["SPACE"]      = 0x20
-    m["ENTER"]      = 0x0D
-    m["RETURN"]     = 0x0D
-    m["ESCAPE"]     = 0x1B
-    m["TAB"]        = 0x09
-    m["INSERT"]     = 0x2D
-    m["DELETE"]     = 0x2E
-    m["HOME"]       = 0x24
-    m["END"]        = 0x23
-    m["PAGEUP"]     = 0x21
-    m["PAGE_UP"]    = 0x21
-    m["PAGEDOWN"]   = 0x22
-    m["PAGE_DOWN"]  = 0x22
-    m["UP"]         = 0x26
-    m["DOWN"]       = 0x28
-    m["LEFT"]       = 0x25
-    m["RIGHT"]      = 0x27
-    m["NUMPAD0"]    = 0x60
-    m["NUMPAD1"]    = 0x61
-    m["NUMPAD2"]    = 0x62
-    m["NUMPAD3"]    = 0x63
-    m["NUMPAD4"]    = 0x64
-    m["NUMPAD5"]    = 0x65
-    m["NUMPAD6"]    = 0x66
-    m["NUMPAD7"]    = 0x67
-    m["NUMPAD8"]    = 0x68
-    m["NUMPAD9"]    = 0x69
-    m["PAUSE"]      = 0x13
-    m["SCROLL_LOCK"] = 0x91
-    m["CAPS_LOCK"]  = 0x14
-    return m
-
-_VK_MAP = _build_vk_map()
+    "SPACE": 0x20, "ENTER": 0x0D, "RETURN": 0x0D, "ESCAPE": 0x1B,
+    "TAB": 0x09, "INSERT": 0x2D, "DELETE": 0x2E, "HOME": 0x24, "END": 0x23,
+    "PAGEUP": 0x21, "PAGE_UP": 0x21, "PAGEDOWN": 0x22, "PAGE_DOWN": 0x22,
+    "UP": 0x26, "DOWN": 0x28, "LEFT": 0x25, "RIGHT": 0x27,
+    "NUMPAD0": 0x60, "NUMPAD1": 0x61, "NUMPAD2": 0x62, "NUMPAD3": 0x63, "NUMPAD4": 0x64,
+    "NUMPAD5": 0x65, "NUMPAD6": 0x66, "NUMPAD7": 0x67, "NUMPAD8": 0x68, "NUMPAD9": 0x69,
+    "PAUSE": 0x13, "SCROLL_LOCK": 0x91, "CAPS_LOCK": 0x14,
+})
 
 # Reverse map: Tkinter keysym → our canonical name
 _TKINTER_KEYSYM_MAP = {
@@ -77,35 +82,42 @@ _TKINTER_KEYSYM_MAP = {
     "Pause": "PAUSE", "Scroll_Lock": "SCROLL_LOCK",
     "Caps_Lock": "CAPS_LOCK",
 }
+# Function keys and the numeric keypad map one-to-one as well
+_TKINTER_KEYSYM_MAP.update({f"F{i}": f"F{i}" for i in range(1, 25)})
+_TKINTER_KEYSYM_MAP.update({f"KP_{i}": f"NUMPAD{i}" for i in range(10)})
+
+# Modifier-only presses are never a hotkey on their own
+_MODIFIER_KEYSYMS = frozenset({
+    "Shift_L", "Shift_R", "Control_L", "Control_R",
+    "Alt_L", "Alt_R", "Super_L", "Super_R", "Meta_L", "Meta_R",
+})
 
 
+@functools.lru_cache(maxsize=256)
 def _name_to_vk(name: str) -> int | None:
     """Convert a key name (e.g. 'F6', 'X') to a Windows virtual-key code."""
-    return _VK_MAP.get(name.upper())
+    return _VK_MAP.get(name) or _VK_MAP.get(name.upper())
 
 
 def _tkinter_event_to_name(event) -> str | None:
     """Convert a Tkinter <KeyPress> event to our canonical key name."""
-    sym = event.keysym
-    # Check special keys
-    if sym in _TKINTER_KEYSYM_MAP:
-        return _TKINTER_KEYSYM_MAP[sym]
-    # Function keys
-    if sym.startswith("F") and sym[1:].isdigit():
-        return sym.upper()
+    return _keysym_to_name(event.keysym, event.char)
+
+
+@functools.lru_cache(maxsize=512)
+def _keysym_to_name(sym: str, char: str) -> str | None:
+    # Special, function and keypad keys
+    name = _TKINTER_KEYSYM_MAP.get(sym)
+    if name:
+        return name
+    if sym in _MODIFIER_KEYSYMS:
+        return None
     # Single printable character
     if len(sym) == 1 and sym.isalnum():
         return sym.upper()
-    # Numeric keypad
-    if sym.startswith("KP_") and sym[3:].isdigit():
-        return f"NUMPAD{sym[3:]}"
-    # Ignore modifier-only presses (Shift, Ctrl, Alt)
-    if sym in ("Shift_L", "Shift_R", "Control_L", "Control_R",
-               "Alt_L", "Alt_R", "Super_L", "Super_R", "Meta_L", "Meta_R"):
-        return None
     # Fallback: try the character
-    if event.char and len(event.char) == 1 and event.char.isalnum():
-        return event.char.upper()
+    if char and len(char) == 1 and char.isalnum():
+        return char.upper()
     return None
 
 
@@ -118,12 +130,15 @@ class HotkeyListener:
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
         self._change_event = threading.Event()   # signal to re-register
+        self._name_lock = threading.Lock()       # pairs name updates with _change_event
+        # Manual-reset Win32 event that wakes the message pump on stop/change
+        self._wake_handle = kernel32.CreateEventW(None, True, False, None)
 
         # Capture state (for Tkinter-based key capture)
         self._capturing = False
         self._on_capture = None
         self._capture_bind_id = None
-        self._capture_root = None
+        self._capture_widget = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -139,30 +154,37 @@ class HotkeyListener:
             return
         self._stop_event.clear()
         self._change_event.clear()
+        kernel32.ResetEvent(self._wake_handle)
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
     def stop(self):
         """Stop the listener."""
         self._stop_event.set()
+        self._change_event.set()   # also releases the unknown-hotkey wait
+        kernel32.SetEvent(self._wake_handle)
         if self._thread:
             self._thread.join(timeout=2)
         self._thread = None
 
     def set_hotkey(self, key_name: str):
         """Change the hotkey (thread-safe, triggers re-registration)."""
-        self._hotkey_name = key_name
-        self._change_event.set()
+        with self._name_lock:
+            self._hotkey_name = key_name
+            self._change_event.set()
+        kernel32.SetEvent(self._wake_handle)
 
-    def begin_capture(self, root, callback):
+    def begin_capture(self, capture_widget, callback):
         """
         Enter capture mode using Tkinter key binding.
-        The next key press on root will be used as the new hotkey.
+        The next key press delivered to *capture_widget* (a toplevel, so
+        it sees keys for all of its children) becomes the new hotkey.
         """
         self._capturing = True
         self._on_capture = callback
-        self._capture_root = root
-        self._capture_bind_id = root.bind_all("<KeyPress>", self._on_tk_key_press)
+        self._capture_widget = capture_widget
+        capture_widget.focus_set()
+        self._capture_bind_id = capture_widget.bind("<KeyPress>", self._on_tk_key_press)
         logger.info("Capture mode started")
 
     def cancel_capture(self):
@@ -175,16 +197,21 @@ class HotkeyListener:
     # Internal — Windows hotkey thread
     # ------------------------------------------------------------------
 
+    def _take_hotkey_name(self) -> str:
+        """Acknowledge pending changes and return the current hotkey name."""
+        with self._name_lock:
+            self._change_event.clear()
+            return self._hotkey_name
+
     def _run(self):
         """Background thread: register hotkey → pump messages → loop."""
         while not self._stop_event.is_set():
-            vk = _name_to_vk(self._hotkey_name)
+            name = self._take_hotkey_name()
+            vk = _name_to_vk(name)
             if vk is None:
-                logger.error("Unknown hotkey '%s' — cannot register", self._hotkey_name)
-                # Wait for a hotkey change or stop
-                while not self._stop_event.is_set() and not self._change_event.is_set():
-                    time.sleep(0.1)
-                self._change_event.clear()
+                logger.error("Unknown hotkey '%s' — cannot register", name)
+                # Wait for a hotkey change or stop (stop() sets both events)
+                self._change_event.wait()
                 continue
 
             # Register
@@ -192,32 +219,48 @@ class HotkeyListener:
             if not ok:
                 err = ctypes.get_last_error()
                 logger.error("RegisterHotKey failed for '%s' (vk=0x%02X), "
-                             "error=%d", self._hotkey_name, vk, err)
-                time.sleep(1)
+                             "error=%d", name, vk, err)
+                self._stop_event.wait(1)
                 continue
 
-            logger.info("Hotkey registered: %s (vk=0x%02X)", self._hotkey_name, vk)
-            self._change_event.clear()
+            logger.info("Hotkey registered: %s (vk=0x%02X)", name, vk)
 
-            # Message pump
+            # Message pump — block until a message arrives or stop()/
+            # set_hotkey() signals the wake event
             msg = wintypes.MSG()
-            while not self._stop_event.is_set() and not self._change_event.is_set():
-                # PeekMessageW with PM_REMOVE (0x1)
-                if user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, 0x0001):
+            msg_ref = ctypes.byref(msg)
+            handles = (wintypes.HANDLE * 1)(self._wake_handle)
+            while not self._stop_event.is_set():
+                if self._change_event.is_set():
+                    # Let a burst of set_hotkey() calls settle, then only
+                    # re-register if the key actually changed
+                    time.sleep(0.005)
+                    new_name = self._take_hotkey_name()
+                    if _name_to_vk(new_name) != vk:
+                        break
+                    name = new_name
+                rc = user32.MsgWaitForMultipleObjectsEx(
+                    1, handles, INFINITE, QS_ALLINPUT, MWMO_INPUTAVAILABLE)
+                if rc == WAIT_OBJECT_0:
+                    kernel32.ResetEvent(self._wake_handle)
+                    continue
+                if rc != WAIT_OBJECT_0 + 1:
+                    logger.error("MsgWaitForMultipleObjectsEx failed, error=%d",
+                                 ctypes.get_last_error())
+                    self._stop_event.wait(0.1)
+                while user32.PeekMessageW(msg_ref, None, 0, 0, PM_REMOVE):
                     if msg.message == WM_HOTKEY and msg.wParam == _HOTKEY_ID:
-                        logger.info("Hotkey triggered: %s", self._hotkey_name)
+                        logger.info("Hotkey triggered: %s", name)
                         if self._on_toggle:
                             try:
                                 self._on_toggle()
                             except Exception as e:
                                 logger.error("Toggle callback error: %s", e,
                                              exc_info=True)
-                time.sleep(0.01)
 
             # Unregister before re-registering or exiting
             user32.UnregisterHotKey(None, _HOTKEY_ID)
-            logger.info("Hotkey unregistered: %s", self._hotkey_name)
-            self._change_event.clear()
+            logger.info("Hotkey unregistered: %s", name)
 
     # ------------------------------------------------------------------
     # Internal — Tkinter capture
@@ -244,10 +287,10 @@ class HotkeyListener:
                 logger.error("Capture callback error: %s", e, exc_info=True)
 
     def _unbind_capture(self):
-        if self._capture_bind_id and self._capture_root:
+        if self._capture_bind_id and self._capture_widget:
             try:
-                self._capture_root.unbind_all("<KeyPress>")
+                self._capture_widget.unbind("<KeyPress>", self._capture_bind_id)
             except Exception:
                 pass
         self._capture_bind_id = None
-        self._capture_root = None
+        self._capture_widget = None
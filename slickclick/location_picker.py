@@ -1,18 +1,76 @@
 """Location picker (floating toolbar) and dry-run preview."""
 
+import ctypes
+import ctypes.wintypes as wintypes
+import sys
+import time
 import tkinter as tk
-import pyautogui
 from pynput import mouse as pynput_mouse
 
-from .constants import COLORS, ICON_PATH
+from .constants import COLORS
 
 
+if sys.platform == "win32":
+    _pt = wintypes.POINT()
+    _pt_ref = ctypes.byref(_pt)
+    _GetCursorPos = ctypes.windll.user32.GetCursorPos
+    _GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
+    _GetCursorPos.restype = wintypes.BOOL
+
+    def _cursor_xy() -> tuple[int, int]:
+        """Current cursor position in screen coordinates."""
+        _GetCursorPos(_pt_ref)
+        return _pt.x, _pt.y
+else:
+    def _cursor_xy() -> tuple[int, int]:
+        """Current cursor position in screen coordinates."""
+        import pyautogui
+        x, y = pyautogui.position()
+        return x, y
+
+_CONTROL_MASK = 0x0004   # Tk event.state bit for a held Ctrl key
+
 # Palette for numbered dot markers
-DOT_COLORS = [
+DOT_COLORS = (
     "#e94560", "#2ecc71", "#3498db", "#f1c40f",
     "#9b59b6", "#e67e22", "#1abc9c", "#e74c3c",
     "#2980b9", "#27ae60", "#f39c12", "#8e44ad",
-]
+)
+_N_DOT_COLORS = len(DOT_COLORS)
+
+# Dot marker sizes (px) and fonts, shared by every spawned dot
+_CAPTURE_DOT_SIZE = 52
+_PREVIEW_DOT_SIZE = 64
+_FONT_CAPTURE_NUM = ("Segoe UI", 10, "bold")
+_FONT_PREVIEW_NUM = ("Segoe UI", 11, "bold")
+_FONT_PREVIEW_COORD = ("Consolas", 7)
+
+
+def _dot_color(number: int) -> str:
+    """Palette color for the 1-based marker *number*."""
+    return DOT_COLORS[(number - 1) % _N_DOT_COLORS]
+
+
+def _make_dot_window(parent, width: int, height: int) -> tk.Toplevel:
+    """Create a hidden, transparent, always-on-top window for a dot marker.
+
+    The window's canvas is kept on it as ``_canvas``; callers draw the
+    marker items once and recolor them on each reuse.
+    """
+    win = tk.Toplevel(parent)
+    win.withdraw()
+    win.overrideredirect(True)
+    win.attributes("-topmost", True)
+
+    # Transparent background (Windows)
+    win.attributes("-transparentcolor", "#010101")
+    win.configure(bg="#010101")
+
+    canvas = tk.Canvas(win, width=width, height=height,
+                       bg="#010101", highlightthickness=0)
+    canvas.pack()
+    win._canvas = canvas
+    return win
 
 
 class LocationPicker:
@@ -32,8 +90,12 @@ class LocationPicker:
         self._pick_count = 0
         self._coord_label = None
         self._count_label = None
-        self._polling_id = None
         self._mouse_listener = None
+        self._dot_pool: list[tk.Toplevel] = []   # hidden capture dots
+        self._last_dot_ts = 0.0
+        # Latest move from the listener thread, flushed once per idle cycle
+        self._pending_xy = None
+        self._coord_flush_pending = False
 
     def show(self, existing_locations: list[tuple[int, int]] | None = None):
         """Open the picker toolbar."""
@@ -41,6 +103,7 @@ class LocationPicker:
             return
 
         self._pick_count = len(existing_locations) if existing_locations else 0
+        accent = COLORS["accent"]
 
         self._toolbar = tk.Toplevel(self._parent)
         self._toolbar.title("SlickClick — Pick Locations")
@@ -48,11 +111,6 @@ class LocationPicker:
         self._toolbar.attributes("-topmost", True)
         self._toolbar.configure(bg=COLORS["bg_dark"])
 
-        try:
-            self._toolbar.iconbitmap(ICON_PATH)
-        except Exception:
-            pass
-
         # --- Layout ---
         bar_width = 420
         bar_height = 110
@@ -63,31 +121,52 @@ class LocationPicker:
         self._toolbar.geometry(f"{bar_width}x{bar_height}+{x_pos}+20")
 
         # Title bar (draggable)
-        title_bar = tk.Frame(self._toolbar, bg=COLORS["accent"], height=28)
+        title_bar = tk.Frame(self._toolbar, bg=accent, height=28)
         title_bar.pack(fill="x")
         title_bar.pack_propagate(False)
 
         title_lbl = tk.Label(
             title_bar, text="⚡ Pick Locations", font=("Segoe UI", 10, "bold"),
-            fg="white", bg=COLORS["accent"],
+            fg="white", bg=accent,
         )
         title_lbl.pack(side="left", padx=8)
 
         close_btn = tk.Label(
             title_bar, text="✕", font=("Segoe UI", 10, "bold"),
-            fg="white", bg=COLORS["accent"], cursor="hand2", padx=8,
+            fg="white", bg=accent, cursor="hand2", padx=8,
         )
         close_btn.pack(side="right")
         close_btn.bind("<Button-1>", lambda e: self._close())
 
-        # Make title bar draggable
+        # Make title bar draggable (motion is only tracked mid-drag)
         title_bar.bind("<Button-1>", self._start_drag)
-        title_bar.bind("<B1-Motion>", self._do_drag)
         title_lbl.bind("<Button-1>", self._start_drag)
-        title_lbl.bind("<B1-Motion>", self._do_drag)
+
+        self._toolbar.focus_force()
+
+        # Delayed focus grab — needed because the tkinter menu holds focus
+        # until it fully closes, so immediate focus_force isn't enough
+        def _grab_focus():
+            if self._toolbar:
+                self._toolbar.lift()
+                self._toolbar.focus_force()
+        self._toolbar.after(150, _grab_focus)
+
+        # The window shell is up; fill in the body on the next idle pass
+        # so show() returns to the event loop straight away
+        self._toolbar.after_idle(self._build_body)
+
+    def _build_body(self):
+        """Populate the toolbar body, then start listening for input."""
+        if self._toolbar is None:
+            return   # closed before the body was built
+
+        # Palette entries used repeatedly below, resolved once
+        bg_card = COLORS["bg_card"]
+        accent = COLORS["accent"]
 
         # Body
-        body = tk.Frame(self._toolbar, bg=COLORS["bg_card"])
+        body = tk.Frame(self._toolbar, bg=bg_card)
         body.pack(fill="both", expand=True)
 
         # Instructions
@@ -95,18 +174,18 @@ class LocationPicker:
             body,
             text="Click anywhere on screen to capture a location",
             font=("Segoe UI", 10, "bold"),
-            fg=COLORS["text_primary"], bg=COLORS["bg_card"],
+            fg=COLORS["text_primary"], bg=bg_card,
         ).pack(pady=(8, 2))
 
         # Live coordinate display + count
-        info_frame = tk.Frame(body, bg=COLORS["bg_card"])
+        info_frame = tk.Frame(body, bg=bg_card)
         info_frame.pack(fill="x", padx=12, pady=(0, 4))
 
         self._coord_label = tk.Label(
             info_frame,
             text="Cursor: (-, -)",
             font=("Consolas", 10),
-            fg=COLORS["accent"], bg=COLORS["bg_card"],
+            fg=accent, bg=bg_card,
             anchor="w",
         )
         self._coord_label.pack(side="left")
@@ -115,7 +194,7 @@ class LocationPicker:
             info_frame,
             text=f"Saved: {self._pick_count}",
             font=("Segoe UI", 10, "bold"),
-            fg=COLORS["success"], bg=COLORS["bg_card"],
+            fg=COLORS["success"], bg=bg_card,
             anchor="e",
         )
         self._count_label.pack(side="right")
@@ -125,44 +204,60 @@ class LocationPicker:
             body,
             text="Press Escape or close to finish  •  Ctrl+Z to undo",
             font=("Segoe UI", 8),
-            fg=COLORS["text_muted"], bg=COLORS["bg_card"],
+            fg=COLORS["text_muted"], bg=bg_card,
         ).pack(pady=(0, 6))
 
-        # Bind keyboard events (Escape to close, Ctrl+Z to undo)
-        self._toolbar.bind("<Escape>", lambda e: self._close())
-        self._toolbar.bind("<Control-z>", self._on_undo)
-
-        self._toolbar.focus_force()
-
-        # Delayed focus grab — needed because the tkinter menu holds focus
-        # until it fully closes, so immediate focus_force isn't enough
-        def _grab_focus():
-            if self._toolbar:
-                self._toolbar.lift()
-                self._toolbar.focus_force()
-        self._toolbar.after(150, _grab_focus)
-
-        # Start polling mouse position
-        self._poll_mouse()
+        # Input handlers touch the labels above, so they are hooked up last.
+        # One keyboard binding for the picker (Escape to close, Ctrl+Z to undo)
+        self._toolbar.bind("<KeyPress>", self._on_key)
 
-        # Start global mouse listener for click-based capture
-        self._mouse_listener = pynput_mouse.Listener(on_click=self._on_mouse_click)
+        # Seed the readout once; the listener below reports every later
+        # move, so this is the only guarded cursor read
+        try:
+            x, y = _cursor_xy()
+        except Exception:
+            pass   # keep the "(-, -)" placeholder until the first move
+        else:
+            self._show_cursor(x, y)
+
+        # Start global mouse listener for click-based capture and the
+        # live coordinate display
+        self._mouse_listener = pynput_mouse.Listener(
+            on_move=self._on_mouse_move, on_click=self._on_mouse_click,
+        )
         self._mouse_listener.start()
 
     # ------------------------------------------------------------------
-    # Mouse position polling
+    # Live cursor readout
     # ------------------------------------------------------------------
 
-    def _poll_mouse(self):
-        """Update the coordinate display with current mouse position."""
+    def _on_mouse_move(self, x, y):
+        """Global mouse move handler from pynput listener."""
         if self._toolbar is None:
             return
-        try:
-            x, y = pyautogui.position()
-            self._coord_label.configure(text=f"Cursor: ({x}, {y})")
-        except Exception:
-            pass
-        self._polling_id = self._toolbar.after(50, self._poll_mouse)
+        # High-rate mice report hundreds of moves a second; keep only the
+        # latest and repaint at most once per Tk idle cycle.  Scheduled on
+        # the parent: a callback queued on the toolbar is dropped when
+        # _close() destroys it, which would leave the flag stuck.
+        self._pending_xy = (int(x), int(y))
+        if not self._coord_flush_pending:
+            self._coord_flush_pending = True
+            self._parent.after_idle(self._flush_cursor)
+
+    def _flush_cursor(self):
+        # Clear the flag before reading so a move landing mid-flush
+        # schedules its own repaint
+        self._coord_flush_pending = False
+        xy = self._pending_xy
+        if xy is None:
+            return   # picker closed since this flush was queued
+        self._show_cursor(*xy)
+
+    def _show_cursor(self, x, y):
+        """Update the coordinate display (called on tkinter thread)."""
+        if self._toolbar is None:
+            return
+        self._coord_label.configure(text=f"Cursor: ({x}, {y})")
 
     # ------------------------------------------------------------------
     # Event handlers
@@ -199,7 +294,7 @@ class LocationPicker:
         self._count_label.configure(text=f"Saved: {self._pick_count}")
 
         # Flash the coordinate display
-        color = DOT_COLORS[(self._pick_count - 1) % len(DOT_COLORS)]
+        color = _dot_color(self._pick_count)
         self._coord_label.configure(
             text=f"✓ Captured #{self._pick_count}: ({x}, {y})",
             fg=color,
@@ -215,6 +310,14 @@ class LocationPicker:
         self._toolbar.lift()
         self._toolbar.focus_force()
 
+    def _on_key(self, event):
+        """Dispatch picker shortcuts from the single <KeyPress> binding."""
+        sym = event.keysym
+        if sym == "Escape":
+            self._close()
+        elif sym == "z" and event.state & _CONTROL_MASK:
+            self._on_undo(event)
+
     def _on_undo(self, event):
         """Signal undo — remove last captured location."""
         if self._pick_count > 0:
@@ -230,49 +333,74 @@ class LocationPicker:
 
     def _show_capture_dot(self, x, y, number):
         """Show a temporary colored dot at the captured position."""
-        color = DOT_COLORS[(number - 1) % len(DOT_COLORS)]
-
-        dot = tk.Toplevel(self._toolbar)
-        dot.overrideredirect(True)
-        dot.attributes("-topmost", True)
-        dot.attributes("-transparentcolor", "#010101")
-        dot.configure(bg="#010101")
-
-        size = 52
-        dot.geometry(f"{size}x{size}+{x - size // 2}+{y - size // 2}")
-
-        canvas = tk.Canvas(dot, width=size, height=size,
-                           bg="#010101", highlightthickness=0)
-        canvas.pack()
-
+        # Rapid captures share the on-screen feedback: at most one new dot
+        # per 100 ms, which also bounds how large the dot pool can grow
+        now = time.monotonic()
+        if now - self._last_dot_ts < 0.1:
+            return
+        self._last_dot_ts = now
+
+        color = _dot_color(number)
+
+        dot = self._dot_pool.pop() if self._dot_pool else self._new_capture_dot()
+        canvas = dot._canvas
+        ring, fill, num = dot._items
+        canvas.itemconfigure(ring, outline=color)
+        canvas.itemconfigure(fill, fill=color)
+        canvas.itemconfigure(num, text=str(number))
+
+        half = _CAPTURE_DOT_SIZE // 2
+        dot.geometry(f"+{x - half}+{y - half}")
+        dot.deiconify()
+        # Hide and return to the pool after 1.5 seconds
+        dot.after(1500, self._release_dot, dot)
+
+    def _new_capture_dot(self):
+        """Build a capture dot window with its canvas items already drawn."""
+        size = _CAPTURE_DOT_SIZE
+        dot = _make_dot_window(self._parent, size, size)
+        canvas = dot._canvas
         cx, cy = size // 2, size // 2
         r = 16
 
-        # Glow ring
-        canvas.create_oval(cx - r - 4, cy - r - 4, cx + r + 4, cy + r + 4,
-                           outline=color, width=2)
-        # Filled circle
-        canvas.create_oval(cx - r, cy - r, cx + r, cy + r,
-                           fill=color, outline="white", width=2)
-        # Number
-        canvas.create_text(cx, cy, text=str(number),
-                           font=("Segoe UI", 10, "bold"), fill="white")
+        dot._items = (
+            # Glow ring
+            canvas.create_oval(cx - r - 4, cy - r - 4, cx + r + 4, cy + r + 4,
+                               width=2),
+            # Filled circle
+            canvas.create_oval(cx - r, cy - r, cx + r, cy + r,
+                               outline="white", width=2),
+            # Number
+            canvas.create_text(cx, cy, font=_FONT_CAPTURE_NUM, fill="white"),
+        )
+        return dot
 
-        # Auto-destroy after 1.5 seconds
-        dot.after(1500, dot.destroy)
+    def _release_dot(self, dot):
+        dot.withdraw()
+        self._dot_pool.append(dot)
 
     # ------------------------------------------------------------------
     # Dragging
     # ------------------------------------------------------------------
 
     def _start_drag(self, event):
-        self._drag_x = event.x
-        self._drag_y = event.y
+        # Remember where the window and pointer started; each motion then
+        # moves by the pointer's offset without querying the window
+        self._drag_origin = (self._toolbar.winfo_x(), self._toolbar.winfo_y())
+        self._drag_click = (event.x_root, event.y_root)
+        # The toplevel is in every child's bindtags, so these see the
+        # drag whichever title widget was pressed
+        self._toolbar.bind("<B1-Motion>", self._do_drag)
+        self._toolbar.bind("<ButtonRelease-1>", self._end_drag)
 
     def _do_drag(self, event):
-        x = self._toolbar.winfo_x() + event.x - self._drag_x
-        y = self._toolbar.winfo_y() + event.y - self._drag_y
-        self._toolbar.geometry(f"+{x}+{y}")
+        ox, oy = self._drag_origin
+        cx, cy = self._drag_click
+        self._toolbar.geometry(f"+{ox + event.x_root - cx}+{oy + event.y_root - cy}")
+
+    def _end_drag(self, event):
+        self._toolbar.unbind("<B1-Motion>")
+        self._toolbar.unbind("<ButtonRelease-1>")
 
     # ------------------------------------------------------------------
     # Cleanup
@@ -286,12 +414,8 @@ class LocationPicker:
             except Exception:
                 pass
             self._mouse_listener = None
-        if self._polling_id:
-            try:
-                self._toolbar.after_cancel(self._polling_id)
-            except Exception:
-                pass
-            self._polling_id = None
+        self._pending_xy = None
+        self._coord_flush_pending = False
         if self._toolbar:
             self._toolbar.destroy()
             self._toolbar = None
@@ -306,7 +430,9 @@ class DryRunPreview:
     def __init__(self, parent):
         self._parent = parent
         self._windows: list[tk.Toplevel] = []
-        self._after_ids: list[str] = []
+        self._pool: list[tk.Toplevel] = []   # hidden dot windows from earlier runs
+        self._tick_id = None      # next staggered reveal
+        self._cleanup_id = None
 
     def show(self, locations: list[tuple[int, int]], interval_ms: int = 300, display_time_ms: int = 4000):
         """
@@ -322,65 +448,76 @@ class DryRunPreview:
 
         self._cleanup()
 
-        for i, (x, y) in enumerate(locations):
-            delay = i * interval_ms
-            after_id = self._parent.after(delay, self._spawn_dot, x, y, i + 1, len(locations))
-            self._after_ids.append(after_id)
+        locations = tuple(locations)
+        total = len(locations)
 
-        # Schedule cleanup after all dots shown + display time
-        total_time = len(locations) * interval_ms + display_time_ms
-        cleanup_id = self._parent.after(total_time, self._cleanup)
-        self._after_ids.append(cleanup_id)
+        # Reveal one dot per tick; each tick schedules the next, so only
+        # one reveal timer is ever pending
+        def _tick(idx):
+            x, y = locations[idx]
+            self._spawn_dot(x, y, idx + 1, total)
+            idx += 1
+            self._tick_id = self._parent.after(interval_ms, _tick, idx) if idx < total else None
 
-    def _spawn_dot(self, x, y, number, total):
-        """Create a small always-on-top dot window at the given position."""
-        color = DOT_COLORS[(number - 1) % len(DOT_COLORS)]
-
-        dot_win = tk.Toplevel(self._parent)
-        dot_win.overrideredirect(True)
-        dot_win.attributes("-topmost", True)
+        _tick(0)
 
-        # Transparent background (Windows)
-        dot_win.attributes("-transparentcolor", "#010101")
-        dot_win.configure(bg="#010101")
-
-        size = 64
-        dot_win.geometry(f"{size}x{size + 20}+{x - size // 2}+{y - size // 2}")
+        # Schedule cleanup after all dots shown + display time
+        total_time = total * interval_ms + display_time_ms
+        self._cleanup_id = self._parent.after(total_time, self._cleanup)
 
-        canvas = tk.Canvas(dot_win, width=size, height=size + 20,
-                           bg="#010101", highlightthickness=0)
-        canvas.pack()
+    def _spawn_dot(self, x, y, number, total):
+        """Show a small always-on-top dot window at the given position."""
+        color = _dot_color(number)
+
+        dot_win = self._pool.pop() if self._pool else self._new_dot()
+        canvas = dot_win._canvas
+        ring, fill, num, coord = dot_win._items
+        canvas.itemconfigure(ring, outline=color)
+        canvas.itemconfigure(fill, fill=color)
+        canvas.itemconfigure(num, text=str(number))
+        canvas.itemconfigure(coord, text=f"({x},{y})", fill=color)
+
+        half = _PREVIEW_DOT_SIZE // 2
+        dot_win.geometry(f"+{x - half}+{y - half}")
+        dot_win.deiconify()
+        self._windows.append(dot_win)
 
+    def _new_dot(self):
+        """Build a preview dot window with its canvas items already drawn."""
+        size = _PREVIEW_DOT_SIZE
+        dot_win = _make_dot_window(self._parent, size, size + 20)
+        canvas = dot_win._canvas
         cx, cy = size // 2, size // 2
         r = 18
 
-        # Outer pulse ring
-        canvas.create_oval(cx - r - 6, cy - r - 6, cx + r + 6, cy + r + 6,
-                           outline=color, width=2)
-        # Main dot
-        canvas.create_oval(cx - r, cy - r, cx + r, cy + r,
-                           fill=color, outline="white", width=2)
-        # Number
-        canvas.create_text(cx, cy, text=str(number),
-                           font=("Segoe UI", 11, "bold"), fill="white")
-        # Coordinate text
-        canvas.create_text(cx, cy + r + 12, text=f"({x},{y})",
-                           font=("Consolas", 7), fill=color)
-
-        self._windows.append(dot_win)
+        dot_win._items = (
+            # Outer pulse ring
+            canvas.create_oval(cx - r - 6, cy - r - 6, cx + r + 6, cy + r + 6,
+                               width=2),
+            # Main dot
+            canvas.create_oval(cx - r, cy - r, cx + r, cy + r,
+                               outline="white", width=2),
+            # Number
+            canvas.create_text(cx, cy, font=_FONT_PREVIEW_NUM, fill="white"),
+            # Coordinate text
+            canvas.create_text(cx, cy + r + 12, font=_FONT_PREVIEW_COORD),
+        )
+        return dot_win
 
     def _cleanup(self):
-        """Remove all dot windows and cancel pending timers."""
-        for after_id in self._after_ids:
-            try:
-                self._parent.after_cancel(after_id)
-            except Exception:
-                pass
-        self._after_ids.clear()
+        """Hide all dot windows for reuse and cancel pending timers."""
+        for after_id in (self._tick_id, self._cleanup_id):
+            if after_id is not None:
+                try:
+                    self._parent.after_cancel(after_id)
+                except Exception:
+                    pass
+        self._tick_id = self._cleanup_id = None
 
         for win in self._windows:
             try:
-                win.destroy()
+                win.withdraw()
             except Exception:
-                pass
+                continue
+            self._pool.append(win)
         self._windows.clear()
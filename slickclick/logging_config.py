@@ -4,8 +4,11 @@ Writes to %APPDATA%/SlickClick/slickclick.log so errors are
 visible even when the app is packaged as a windowless exe.
 """
 
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 _LOG_DIR = os.path.join(os.environ.get("APPDATA", "."), "SlickClick")
 os.makedirs(_LOG_DIR, exist_ok=True)
@@ -14,11 +17,19 @@ _LOG_FILE = os.path.join(_LOG_DIR, "slickclick.log")
 logger = logging.getLogger("slickclick")
 logger.setLevel(logging.DEBUG)
 
-# File handler — rotates implicitly by overwriting each launch
-_fh = logging.FileHandler(_LOG_FILE, mode="w", encoding="utf-8")
+# File handler — rotates implicitly by overwriting each launch; the file
+# is only opened (and truncated) when the first record is written
+_fh = logging.FileHandler(_LOG_FILE, mode="w", encoding="utf-8", delay=True)
 _fh.setLevel(logging.DEBUG)
 _fh.setFormatter(logging.Formatter(
     "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     datefmt="%H:%M:%S",
 ))
-logger.addHandler(_fh)
+
+# Log calls only enqueue the record; a background listener thread owns the
+# file handler, so disk writes never stall the caller (e.g. the click loop)
+_queue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(_queue))
+_listener = QueueListener(_queue, _fh, respect_handler_level=True)
+_listener.start()
+atexit.register(_listener.stop)
@@ -9,7 +9,6 @@ from .logging_config import logger
 from .gui import SlickClickGUI
 from .clicker import ClickerEngine
 from .hotkey import HotkeyListener
-from .location_picker import LocationPicker, DryRunPreview
 from .notifications import ToastNotification, OSDIndicator
 from .constants import COLORS, ICON_PATH
 from . import config
@@ -25,6 +24,8 @@ except ImportError:
 class SlickClickApp:
     """Application controller — connects all components."""
 
+    _COUNT_POLL_MS = 50   # click counter refresh rate while running (20 Hz)
+
     def __init__(self):
         # Enable Per-Monitor DPI awareness (Windows 10 1607+)
         try:
@@ -36,22 +37,24 @@ class SlickClickApp:
         self.gui = SlickClickGUI(self.root)
         self.engine = ClickerEngine()
         self.hotkey = HotkeyListener(on_toggle=self._toggle_clicking)
-        self.picker = LocationPicker(self.root, on_location_picked=self._on_location_picked)
-        self.dry_run = DryRunPreview(self.root)
+        # Picker and preview pull in pynput; built on first use
+        self.picker = None
+        self.dry_run = None
         self.toast = ToastNotification(self.root)
         self.osd = OSDIndicator(self.root)
+        self._count_poll_id = None
+        self._pending_status = False
+        self._status_update_scheduled = False
 
         # Wire callbacks
-        self.engine.set_callbacks(
-            on_status_change=self._on_status_change,
-            on_click_count_update=self._on_click_count_update,
-        )
+        self.engine.set_callbacks(on_status_change=self._on_status_change)
 
         # Override GUI stub callbacks
         self.gui._on_start_btn = self._toggle_clicking
         self.gui._on_pick_location = self._open_picker
         self.gui._on_dry_run = self._run_dry_preview
         self.gui._on_set_hotkey = self._begin_hotkey_capture
+        self.gui._on_cancel_hotkey = self._cancel_hotkey_capture
         self.gui._on_close = self._on_close
 
         # Start hotkey listener
@@ -115,14 +118,15 @@ class SlickClickApp:
 
     def _open_picker(self):
         """Open the floating location picker toolbar."""
-        import traceback
         try:
-            self.picker._on_undo_callback = self._on_picker_undo
+            if self.picker is None:
+                from .location_picker import LocationPicker
+                self.picker = LocationPicker(self.root, on_location_picked=self._on_location_picked)
+                self.picker._on_undo_callback = self._on_picker_undo
             self.picker.show(existing_locations=self.gui._locations)
-            print("[SlickClick] Picker opened successfully", flush=True)
-        except Exception as e:
-            print(f"[SlickClick] ERROR opening picker: {e}", flush=True)
-            traceback.print_exc()
+            logger.debug("Picker opened")
+        except Exception:
+            logger.exception("Failed to open picker")
 
     def _run_dry_preview(self):
         """Run dry-run preview showing dots at all saved locations."""
@@ -132,27 +136,56 @@ class SlickClickApp:
         interval = self.gui.get_interval_ms()
         # Use the configured interval for staggering, capped between 200-1000ms for usability
         stagger = max(200, min(1000, interval))
+        if self.dry_run is None:
+            from .location_picker import DryRunPreview
+            self.dry_run = DryRunPreview(self.root)
         self.dry_run.show(locations, interval_ms=stagger, display_time_ms=4000)
 
     def _begin_hotkey_capture(self, dlg=None):
         """Enter hotkey capture mode."""
-        if hasattr(self.gui, '_settings_hotkey_label') and self.gui._settings_hotkey_label.winfo_exists():
+        # The settings dialog is cached, so once built these widgets live
+        # as long as the app
+        if self.gui._settings_hotkey_label is not None:
             self.gui._settings_hotkey_label.configure(text="Press a key...")
-        if hasattr(self.gui, '_set_hotkey_btn') and self.gui._set_hotkey_btn.winfo_exists():
+        if self.gui._set_hotkey_btn is not None:
             self.gui._set_hotkey_btn.configure(state="disabled")
-        self.hotkey.begin_capture(root=self.root, callback=self._on_hotkey_captured)
+        self.hotkey.begin_capture(dlg or self.root, callback=self._on_hotkey_captured)
+
+    def _cancel_hotkey_capture(self):
+        """Leave capture mode without changing the hotkey."""
+        self.hotkey.cancel_capture()
+        if self.gui._settings_hotkey_label is not None:
+            self.gui._settings_hotkey_label.configure(text=self.gui._hotkey_name)
+        if self.gui._set_hotkey_btn is not None:
+            self.gui._set_hotkey_btn.configure(state="normal")
 
     # ------------------------------------------------------------------
     # Callbacks (may be called from background threads)
     # ------------------------------------------------------------------
 
     def _on_status_change(self, running: bool):
-        """Thread-safe status update."""
-        self.root.after(0, self._handle_status_change, running)
+        """Thread-safe status update, applied in one pass on the next idle."""
+        self._pending_status = running
+        if not self._status_update_scheduled:
+            self._status_update_scheduled = True
+            self.root.after_idle(self._apply_status_updates)
+
+    def _apply_status_updates(self):
+        # Only the latest state matters if several changes queued up
+        self._status_update_scheduled = False
+        self._handle_status_change(self._pending_status)
 
     def _handle_status_change(self, running: bool):
         """Update GUI, toast, and OSD on the main thread."""
         self.gui.update_status(running)
+        if running:
+            if self._count_poll_id is None:
+                self._poll_click_count()
+        else:
+            if self._count_poll_id is not None:
+                self.root.after_cancel(self._count_poll_id)
+                self._count_poll_id = None
+            self.gui.update_click_count(self.engine.click_count)
         # Toast notification
         if self.gui.show_toast.get():
             self.toast.show(running)
@@ -165,10 +198,13 @@ class SlickClickApp:
         elif not running:
             self.osd.hide()  # always hide when stopping
 
-    def _on_click_count_update(self, count: int):
-        """Thread-safe click count update (throttled)."""
-        if count % 10 == 0 or count <= 10:
-            self.root.after(0, self.gui.update_click_count, count)
+    def _poll_click_count(self):
+        """Refresh the click counter from the engine while it is running."""
+        self.gui.update_click_count(self.engine.click_count)
+        if self.engine.running:
+            self._count_poll_id = self.root.after(self._COUNT_POLL_MS, self._poll_click_count)
+        else:
+            self._count_poll_id = None
 
     def _on_location_picked(self, x: int, y: int):
         """Called when user captures a position in the picker."""
@@ -176,9 +212,7 @@ class SlickClickApp:
 
     def _on_picker_undo(self):
         """Called when user presses Ctrl+Z in the picker — remove last location."""
-        if self.gui._locations:
-            self.gui._locations.pop()
-            self.gui._update_location_indicator()
+        self.gui.remove_location(len(self.gui._locations) - 1)
 
     def _on_hotkey_captured(self, key_name: str):
         """Called when a new hotkey is captured."""
@@ -187,16 +221,10 @@ class SlickClickApp:
     def _apply_captured_hotkey(self, key_name: str):
         self.gui.update_hotkey_display(key_name)
         self.hotkey.set_hotkey(key_name)
-        if hasattr(self.gui, '_settings_hotkey_label'):
-            try:
-                self.gui._settings_hotkey_label.configure(text=key_name)
-            except Exception:
-                pass
-        if hasattr(self.gui, '_set_hotkey_btn'):
-            try:
-                self.gui._set_hotkey_btn.configure(state="normal")
-            except Exception:
-                pass
+        if self.gui._settings_hotkey_label is not None:
+            self.gui._settings_hotkey_label.configure(text=key_name)
+        if self.gui._set_hotkey_btn is not None:
+            self.gui._set_hotkey_btn.configure(state="normal")
         # Persist immediately
         self._save_settings()
 
@@ -307,9 +335,12 @@ class SlickClickApp:
 
     def _exit_app(self):
         """Fully exit the application."""
+        from .updater import cancel_update_check
+
         self._save_settings()
         self.engine.stop()
         self.hotkey.stop()
+        cancel_update_check()
         self.root.destroy()
         sys.exit(0)
 
@@ -356,19 +387,23 @@ class SlickClickApp:
     def _save_settings(self):
         """Gather current state from GUI and save."""
         try:
+            gui = self.gui
+            interval = gui._interval_cache
+            repeat_text = gui.repeat_count_var.get()
             cfg = {
-                "hotkey": self.gui._hotkey_name,
-                "interval_hours": int(self.gui.hours_var.get() or 0),
-                "interval_mins": int(self.gui.mins_var.get() or 0),
-                "interval_secs": int(self.gui.secs_var.get() or 0),
-                "interval_ms": int(self.gui.ms_var.get() or 0),
-                "mouse_button": self.gui.button_var.get(),
-                "click_type": self.gui.type_var.get(),
-                "repeat_mode": self.gui.repeat_mode.get(),
-                "repeat_count": int(self.gui.repeat_count_var.get() or 50),
-                "show_toast": self.gui.show_toast.get(),
-                "show_osd": self.gui.show_osd.get(),
-                "start_delay_secs": self.gui.get_start_delay_secs(),
+                "hotkey": gui._hotkey_name,
+                "interval_hours": interval["h"] or 0,
+                "interval_mins": interval["m"] or 0,
+                "interval_secs": interval["s"] or 0,
+                "interval_ms": interval["ms"] or 0,
+                "mouse_button": gui.button_var.get(),
+                "click_type": gui.type_var.get(),
+                "repeat_mode": gui.repeat_mode.get(),
+                "repeat_count": (int(repeat_text) if repeat_text.isascii()
+                                 and repeat_text.isdecimal() else 50),
+                "show_toast": gui.show_toast.get(),
+                "show_osd": gui.show_osd.get(),
+                "start_delay_secs": gui.get_start_delay_secs(),
             }
             config.save(cfg)
         except Exception:
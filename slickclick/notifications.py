@@ -6,6 +6,8 @@ The OSD uses ctypes to set WS_EX_TRANSPARENT so clicks pass through.
 
 import ctypes
 import ctypes.wintypes as wintypes
+import itertools
+import time
 import tkinter as tk
 
 from .constants import COLORS
@@ -17,27 +19,138 @@ WS_EX_TRANSPARENT = 0x00000020
 WS_EX_LAYERED = 0x00080000
 WS_EX_TOOLWINDOW = 0x00000080
 WS_EX_TOPMOST = 0x00000008
+LWA_ALPHA = 0x00000002
 
 user32 = ctypes.windll.user32
+user32.GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+user32.GetWindowLongW.restype = ctypes.c_long
+user32.SetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int, ctypes.c_long]
+user32.SetWindowLongW.restype = ctypes.c_long
+user32.SetLayeredWindowAttributes.argtypes = [wintypes.HWND, wintypes.COLORREF,
+                                              wintypes.BYTE, wintypes.DWORD]
+user32.SetLayeredWindowAttributes.restype = wintypes.BOOL
+
+# Extended style applied by _make_click_through, read from the first window
+# it handles.  Every caller is an overrideredirect, topmost, -alpha layered
+# toplevel, so they all start from the same base style.
+_click_through_style: int | None = None
+
+# Screen size per Tk root, looked up once — it doesn't change mid-session
+_screen_sizes: dict[int, tuple[int, int]] = {}
+
+
+def _screen_size(root: tk.Tk) -> tuple[int, int]:
+    """Return ``(width, height)`` of *root*'s screen, cached after first use."""
+    size = _screen_sizes.get(id(root))
+    if size is None:
+        # Both dimensions in one Tcl round-trip.  Not wm_maxsize: on
+        # Windows that spans the whole virtual desktop, not this screen.
+        w, h = root.tk.splitlist(root.tk.eval(
+            f"list [winfo screenwidth {root}] [winfo screenheight {root}]"))
+        size = _screen_sizes[id(root)] = (int(w), int(h))
+    return size
+
+
+class _AnimationDriver:
+    """One Tk timer shared by every notification animation on a root.
+
+    ``after``/``cancel`` mirror Tk's, but callbacks are queued here with
+    their due time.  Each tick reads the clock once, runs everything that
+    is due, and re-arms a single timer for the next entry; with nothing
+    queued no timer is pending at all.
+    """
+
+    def __init__(self, root: tk.Tk):
+        self._root = root
+        self._pending: dict[int, tuple[float, object]] = {}
+        self._tokens = itertools.count(1)
+        self._timer_id = None
+        self._timer_due = 0.0
+        self._ticking = False
+
+    def after(self, ms: int, callback) -> int:
+        token = next(self._tokens)
+        due = time.perf_counter() + ms / 1000
+        self._pending[token] = (due, callback)
+        # During a tick the timer is re-armed once everything has run
+        if not self._ticking and (self._timer_id is None or due < self._timer_due):
+            self._arm(due)
+        return token
+
+    def cancel(self, token: int):
+        self._pending.pop(token, None)
+        if not self._pending and self._timer_id is not None:
+            self._root.after_cancel(self._timer_id)
+            self._timer_id = None
+
+    def _arm(self, due: float):
+        if self._timer_id is not None:
+            self._root.after_cancel(self._timer_id)
+        delay = max(1, round((due - time.perf_counter()) * 1000))
+        self._timer_id = self._root.after(delay, self._tick)
+        self._timer_due = due
+
+    def _tick(self):
+        self._timer_id = None
+        self._ticking = True
+        try:
+            now = time.perf_counter()
+            for token in [t for t, (due, _) in self._pending.items() if due <= now]:
+                # An earlier callback may have cancelled this one
+                entry = self._pending.pop(token, None)
+                if entry is not None:
+                    entry[1]()
+        finally:
+            self._ticking = False
+            if self._pending:
+                self._arm(min(due for due, _ in self._pending.values()))
+
+
+_drivers: dict[int, _AnimationDriver] = {}
+
+
+def _animation_driver(root: tk.Tk) -> _AnimationDriver:
+    """Return the shared animation driver for *root*, creating it on first use."""
+    driver = _drivers.get(id(root))
+    if driver is None:
+        driver = _drivers[id(root)] = _AnimationDriver(root)
+    return driver
+
+
+def _frame_hwnd(toplevel: tk.Toplevel) -> int:
+    """Return the Win32 HWND of *toplevel*'s outer frame.
+
+    The frame only exists once the window has been mapped or updated, so
+    call this after ``update_idletasks()``; the handle is then stable for
+    the window's lifetime and callers keep it.
+    """
+    frame_id = toplevel.wm_frame()
+    return int(frame_id, 16) if frame_id else toplevel.winfo_id()
+
+
+def _set_opacity(hwnd: int, alpha: float):
+    """Set a layered window's opacity directly, skipping Tk's -alpha path.
+
+    Only for windows Tk has already made layered via ``-alpha``; Tk's own
+    idea of the alpha goes stale, so don't mix the two afterwards.
+    """
+    user32.SetLayeredWindowAttributes(hwnd, 0, round(alpha * 255), LWA_ALPHA)
 
 
-def _make_click_through(toplevel: tk.Toplevel):
-    """Make a Toplevel window click-through using Windows extended styles.
+def _make_click_through(hwnd: int):
+    """Make a Toplevel's frame *hwnd* click-through using Windows extended styles.
 
     Only adds WS_EX_TRANSPARENT (pass-through clicks) and WS_EX_TOOLWINDOW
     (hide from taskbar).  Do NOT add WS_EX_LAYERED here — Tkinter already
     sets that via the ``-alpha`` attribute, and re-setting it wipes the
     rendered content to a grey box.
     """
+    global _click_through_style
     try:
-        # Get the actual Win32 HWND from Tkinter's frame id
-        frame_id = toplevel.wm_frame()
-        hwnd = int(frame_id, 16) if frame_id else toplevel.winfo_id()
-        style = user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
-        user32.SetWindowLongW(
-            hwnd, GWL_EXSTYLE,
-            style | WS_EX_TRANSPARENT | WS_EX_TOOLWINDOW,
-        )
+        if _click_through_style is None:
+            style = user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
+            _click_through_style = style | WS_EX_TRANSPARENT | WS_EX_TOOLWINDOW
+        user32.SetWindowLongW(hwnd, GWL_EXSTYLE, _click_through_style)
     except Exception as e:
         logger.error("Failed to set click-through: %s", e)
 
@@ -48,13 +161,21 @@ class ToastNotification:
     _DISPLAY_MS = 2000       # how long the toast stays visible
     _ANIM_STEP_MS = 16       # ~60 fps animation
     _SLIDE_DISTANCE = 120    # pixels to slide in from
+    _SLIDE_SECS = 0.18       # slide-in duration, independent of frame rate
     _TOAST_WIDTH = 220
     _TOAST_HEIGHT = 44
+    _SIZE_STR = f"{_TOAST_WIDTH}x{_TOAST_HEIGHT}"
+    _FONT = ("Segoe UI", 11, "bold")
     _MARGIN = 20             # margin from screen edge
+    _ALPHA = 0.92            # resting opacity
+    _FADE_STEP_MS = 90       # fade is one half-opacity frame, then hidden
 
     def __init__(self, root: tk.Tk):
         self._root = root
-        self._win: tk.Toplevel | None = None
+        self._anim = _animation_driver(root)
+        self._win: tk.Toplevel | None = None   # built on first show, then reused
+        self._label: tk.Label | None = None
+        self._hwnd: int | None = None
         self._anim_id = None
         self._dismiss_id = None
 
@@ -65,97 +186,117 @@ class ToastNotification:
         text = "● Clicker Started" if running else "● Clicker Stopped"
         fg = COLORS["success"] if running else COLORS["accent"]
 
-        win = tk.Toplevel(self._root)
-        win.overrideredirect(True)
-        win.attributes("-topmost", True)
-        win.attributes("-alpha", 0.92)
-        win.configure(bg=COLORS["bg_dark"])
-        win.withdraw()  # hide until positioned
-
-        # Content
-        frame = tk.Frame(win, bg=COLORS["bg_card"],
-                         highlightbackground=COLORS["border"],
-                         highlightthickness=1)
-        frame.pack(fill="both", expand=True)
-
-        tk.Label(
-            frame, text=text, font=("Segoe UI", 11, "bold"),
-            fg=fg, bg=COLORS["bg_card"],
-        ).pack(padx=16, pady=10)
-
-        self._win = win
+        if self._win is None:
+            self._build()
+        elif self._alpha != self._ALPHA:
+            _set_opacity(self._hwnd, self._ALPHA)
+            self._alpha = self._ALPHA
+        win = self._win
+        self._label.configure(text=text, fg=fg)
 
         # Calculate final position (bottom-right)
-        screen_w = self._root.winfo_screenwidth()
-        screen_h = self._root.winfo_screenheight()
+        screen_w, screen_h = _screen_size(self._root)
 
         self._final_x = screen_w - self._TOAST_WIDTH - self._MARGIN
         self._final_y = screen_h - self._TOAST_HEIGHT - self._MARGIN - 40  # above taskbar
         self._current_x = self._final_x + self._SLIDE_DISTANCE
+        # Size is set once below; animation frames only move the window
+        self._move_fmt = f"+{{}}+{self._final_y}"
 
         # Start slide-in animation
-        win.geometry(f"{self._TOAST_WIDTH}x{self._TOAST_HEIGHT}"
-                     f"+{self._current_x}+{self._final_y}")
+        self._anim_start = time.perf_counter()
+        win.geometry(f"{self._SIZE_STR}+{self._current_x}+{self._final_y}")
         win.deiconify()
 
         # Make click-through so the toast doesn't steal focus
         win.update_idletasks()
-        hwnd = int(win.wm_frame(), 16) if win.wm_frame() else ctypes.windll.user32.GetForegroundWindow()
-        try:
-            hwnd = ctypes.windll.user32.FindWindowW(None, None)
-            hwnd = win.winfo_id()
-        except Exception:
-            pass
+        if self._hwnd is None:
+            self._hwnd = _frame_hwnd(win)
+        _make_click_through(self._hwnd)
 
         self._slide_in()
 
+    def _build(self):
+        """Create the toast window once; later toasts reuse it."""
+        win = tk.Toplevel(self._root)
+        win.overrideredirect(True)
+        win.attributes("-topmost", True)
+        win.configure(bg=COLORS["bg_dark"])
+        # Makes the window layered; later opacity changes go through
+        # _set_opacity on the cached HWND
+        win.attributes("-alpha", self._ALPHA)
+        self._alpha = self._ALPHA
+        win.withdraw()  # hide until positioned
+
+        # Content
+        frame = tk.Frame(win, bg=COLORS["bg_card"],
+                         highlightbackground=COLORS["border"],
+                         highlightthickness=1)
+        frame.pack(fill="both", expand=True)
+
+        self._label = tk.Label(
+            frame, font=self._FONT, bg=COLORS["bg_card"],
+        )
+        self._label.pack(padx=16, pady=10)
+
+        self._win = win
+
     def _slide_in(self):
-        """Animate the toast sliding in from the right."""
+        """Animate the toast sliding in from the right.
+
+        Position follows elapsed time (ease-out cubic), so a late frame
+        jumps ahead instead of stretching the animation.
+        """
+        self._anim_id = None
         if self._win is None:
             return
-        if self._current_x > self._final_x:
-            step = max(2, (self._current_x - self._final_x) // 4)
-            self._current_x -= step
-            if self._current_x < self._final_x:
-                self._current_x = self._final_x
-            self._win.geometry(f"{self._TOAST_WIDTH}x{self._TOAST_HEIGHT}"
-                               f"+{self._current_x}+{self._final_y}")
-            self._anim_id = self._root.after(self._ANIM_STEP_MS, self._slide_in)
+        t = min(1.0, (time.perf_counter() - self._anim_start) / self._SLIDE_SECS)
+        remaining = (1.0 - t) ** 3
+        self._current_x = self._final_x + round(self._SLIDE_DISTANCE * remaining)
+        self._win.wm_geometry(self._move_fmt.format(self._current_x))
+        if t < 1.0:
+            self._anim_id = self._anim.after(self._ANIM_STEP_MS, self._slide_in)
         else:
             # Arrived — schedule dismiss
             self._dismiss_id = self._root.after(self._DISPLAY_MS, self._fade_out)
 
     def _fade_out(self):
-        """Fade out the toast."""
+        """Fade out the toast.
+
+        Each opacity change re-composites the whole layered window, so the
+        fade is a single half-opacity step before hiding.
+        """
+        # Reached from either the dismiss timer or the fade step
+        self._anim_id = self._dismiss_id = None
         if self._win is None:
             return
-        try:
-            alpha = self._win.attributes("-alpha")
-            if alpha > 0.1:
-                self._win.attributes("-alpha", alpha - 0.08)
-                self._anim_id = self._root.after(self._ANIM_STEP_MS, self._fade_out)
-            else:
-                self._destroy()
-        except Exception:
-            self._destroy()
+        if self._alpha == self._ALPHA:
+            self._alpha = self._ALPHA / 2
+            _set_opacity(self._hwnd, self._alpha)
+            self._anim_id = self._anim.after(self._FADE_STEP_MS, self._fade_out)
+        else:
+            self._hide()
 
     def _cancel(self):
-        """Cancel any running animation and destroy existing toast."""
+        """Cancel any running animation and hide the current toast."""
+        # Both ids clear once their callback has run, so with neither
+        # pending the last toast has already faded and been hidden
+        if self._anim_id is None and self._dismiss_id is None:
+            return
         if self._anim_id:
-            self._root.after_cancel(self._anim_id)
+            self._anim.cancel(self._anim_id)
             self._anim_id = None
         if self._dismiss_id:
             self._root.after_cancel(self._dismiss_id)
             self._dismiss_id = None
-        self._destroy()
+        self._hide()
 
-    def _destroy(self):
-        if self._win:
+    def _hide(self):
+        if self._win is not None:
             try:
-                self._win.destroy()
+                self._win.withdraw()
             except Exception:
                 pass
-            self._win = None
 
 
 class OSDIndicator:
@@ -168,10 +309,15 @@ class OSDIndicator:
     _WIDTH = 110
     _HEIGHT = 28
     _MARGIN = 16
+    _SIZE_STR = f"{_WIDTH}x{_HEIGHT}"
+    _DOT_FONT = ("Segoe UI", 10)
+    _TEXT_FONT = ("Segoe UI", 9, "bold")
 
     def __init__(self, root: tk.Tk):
         self._root = root
+        self._anim = _animation_driver(root)
         self._win: tk.Toplevel | None = None
+        self._hwnd: int | None = None
         self._pulse_id = None
         self._pulse_on = True
 
@@ -187,10 +333,10 @@ class OSDIndicator:
         win.configure(bg=COLORS["bg_dark"])
 
         # Position: top-right corner
-        screen_w = self._root.winfo_screenwidth()
+        screen_w, _ = _screen_size(self._root)
         x = screen_w - self._WIDTH - self._MARGIN
         y = self._MARGIN
-        win.geometry(f"{self._WIDTH}x{self._HEIGHT}+{x}+{y}")
+        win.geometry(f"{self._SIZE_STR}+{x}+{y}")
 
         frame = tk.Frame(win, bg=COLORS["accent"],
                          highlightbackground=COLORS["accent_dim"],
@@ -198,13 +344,13 @@ class OSDIndicator:
         frame.pack(fill="both", expand=True)
 
         self._dot_label = tk.Label(
-            frame, text="●", font=("Segoe UI", 10),
+            frame, text="●", font=self._DOT_FONT,
             fg="white", bg=COLORS["accent"],
         )
         self._dot_label.pack(side="left", padx=(8, 4))
 
         tk.Label(
-            frame, text="CLICKING", font=("Segoe UI", 9, "bold"),
+            frame, text="CLICKING", font=self._TEXT_FONT,
             fg="white", bg=COLORS["accent"],
         ).pack(side="left", padx=(0, 8))
 
@@ -212,16 +358,19 @@ class OSDIndicator:
 
         # Make click-through
         win.update_idletasks()
-        _make_click_through(win)
+        self._hwnd = _frame_hwnd(win)
+        _make_click_through(self._hwnd)
 
-        # Start pulsing dot
+        # Start pulsing dot; it pauses whenever the window is unmapped
         self._pulse_on = True
+        win.bind("<Unmap>", self._suspend_pulse)
+        win.bind("<Map>", self._resume_pulse)
         self._pulse()
 
     def hide(self):
         """Hide the OSD indicator."""
         if self._pulse_id:
-            self._root.after_cancel(self._pulse_id)
+            self._anim.cancel(self._pulse_id)
             self._pulse_id = None
         if self._win:
             try:
@@ -229,6 +378,17 @@ class OSDIndicator:
             except Exception:
                 pass
             self._win = None
+            self._hwnd = None
+
+    def _suspend_pulse(self, event):
+        # Child widgets report through the toplevel's bindings too
+        if event.widget is self._win and self._pulse_id:
+            self._anim.cancel(self._pulse_id)
+            self._pulse_id = None
+
+    def _resume_pulse(self, event):
+        if event.widget is self._win and self._pulse_id is None:
+            self._pulse()
 
     def _pulse(self):
         """Pulse the dot to indicate activity."""
@@ -238,6 +398,6 @@ class OSDIndicator:
             self._pulse_on = not self._pulse_on
             color = "white" if self._pulse_on else COLORS["accent"]
             self._dot_label.configure(fg=color)
-            self._pulse_id = self._root.after(600, self._pulse)
+            self._pulse_id = self._anim.after(600, self._pulse)
         except Exception:
             pass
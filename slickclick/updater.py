@@ -1,22 +1,126 @@
 """Check for updates via the GitHub Releases API."""
 
+import functools
+import http.client
+import os
+import re
+import socket
 import threading
-import urllib.request
 import json
 
+from .config import CONFIG_PATH
 from .constants import APP_VERSION
 from .logging_config import logger
 
-_GITHUB_API = "https://api.github.com/repos/GoblinRules/SlickClick/releases/latest"
+_API_HOST = "api.github.com"
+_API_PATH = "/repos/GoblinRules/SlickClick/releases/latest"
+_HEADERS = {"Accept": "application/vnd.github.v3+json",
+            "User-Agent": "SlickClick-UpdateChecker"}
 
+# Only two fields are needed out of a ~50 KB document; the first html_url
+# in the payload is the release's own (assets and author come later)
+_TAG_RE = re.compile(rb'"tag_name"\s*:\s*"([^"]+)"')
+_URL_RE = re.compile(rb'"html_url"\s*:\s*"([^"]+)"')
 
+_VER_RE = re.compile(r"\d+(?:\.\d+)*")
+
+# One keep-alive connection shared by all checks; the lock serializes them
+_conn_lock = threading.Lock()
+_conn: http.client.HTTPSConnection | None = None
+_TIMEOUT = 4
+_cancelled = threading.Event()
+
+# Last successful answer: (etag, tag_name, html_url).  Sent back as
+# If-None-Match so an unchanged release comes back as a bodiless 304.
+# Persisted next to the config so the saving carries across launches.
+_RELEASE_CACHE_PATH = os.path.join(os.path.dirname(CONFIG_PATH), "update_cache.json")
+_last_release: tuple[str, str, str] | None = None
+_release_cache_loaded = False
+
+
+def _load_release_cache():
+    global _last_release, _release_cache_loaded
+    _release_cache_loaded = True
+    try:
+        with open(_RELEASE_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        _last_release = (data["etag"], data["tag_name"], data["html_url"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+
+def _save_release_cache():
+    etag, tag, html_url = _last_release
+    try:
+        with open(_RELEASE_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump({"etag": etag, "tag_name": tag, "html_url": html_url}, f)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=64)
 def _parse_version(tag: str) -> tuple[int, ...]:
     """Convert a version tag like 'V1.2.0' or 'v1.2.0' to a tuple of ints."""
     cleaned = tag.lstrip("vV").strip()
-    try:
-        return tuple(int(p) for p in cleaned.split("."))
-    except ValueError:
+    if not _VER_RE.fullmatch(cleaned):
         return (0,)
+    return tuple(map(int, cleaned.split(".")))
+
+
+_CURRENT_VERSION = _parse_version(APP_VERSION)
+
+
+def _fetch_latest() -> tuple[str, str]:
+    """Return ``(tag_name, html_url)`` of the latest release.
+
+    Must be called with ``_conn_lock`` held.  A connection the server has
+    already dropped is replaced and the request retried once.
+    """
+    global _conn, _last_release
+    if not _release_cache_loaded:
+        _load_release_cache()
+    headers = dict(_HEADERS)
+    if _last_release is not None:
+        headers["If-None-Match"] = _last_release[0]
+
+    for attempt in range(2):
+        if _conn is None:
+            _conn = http.client.HTTPSConnection(_API_HOST, timeout=_TIMEOUT)
+        try:
+            _conn.request("GET", _API_PATH, headers=headers)
+            resp = _conn.getresponse()
+            body = resp.read()   # drain so the connection can be reused
+            break
+        except socket.timeout:
+            # A stalled server, not a stale keep-alive: don't wait twice
+            _conn.close()
+            _conn = None
+            raise
+        except (http.client.HTTPException, OSError):
+            _conn.close()
+            _conn = None
+            if attempt or _cancelled.is_set():
+                raise
+
+    if resp.status == 304 and _last_release is not None:
+        return _last_release[1], _last_release[2]
+    if resp.status != 200:
+        raise RuntimeError(f"HTTP {resp.status} {resp.reason}")
+
+    tag_m = _TAG_RE.search(body)
+    url_m = _URL_RE.search(body)
+    if tag_m and url_m:
+        tag = tag_m.group(1).decode("utf-8")
+        html_url = url_m.group(1).decode("utf-8")
+    else:
+        data = json.loads(body.decode("utf-8"))
+        tag = data.get("tag_name", "")
+        html_url = data.get("html_url", "")
+    etag = resp.getheader("ETag")
+    if etag:
+        _last_release = (etag, tag, html_url)
+        _save_release_cache()
+    return tag, html_url
 
 
 def check_for_updates(callback):
@@ -30,20 +134,12 @@ def check_for_updates(callback):
 
     def _worker():
         try:
-            req = urllib.request.Request(
-                _GITHUB_API,
-                headers={"Accept": "application/vnd.github.v3+json",
-                          "User-Agent": "SlickClick-UpdateChecker"},
-            )
-            with urllib.request.urlopen(req, timeout=8) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
-
-            tag = data.get("tag_name", "")
+            with _conn_lock:
+                tag, html_url = _fetch_latest()
+
             latest = _parse_version(tag)
-            current = _parse_version(APP_VERSION)
-            html_url = data.get("html_url", "")
 
-            if latest > current:
+            if latest > _CURRENT_VERSION:
                 # Strip the leading v/V for display
                 display = tag.lstrip("vV")
                 logger.info("Update available: %s → %s", APP_VERSION, display)
@@ -53,7 +149,28 @@ def check_for_updates(callback):
                 callback({"up_to_date": True})
 
         except Exception as e:
+            if _cancelled.is_set():
+                logger.info("Update check cancelled")
+                return
             logger.error("Update check failed: %s", e)
             callback({"error": str(e)})
 
+    _cancelled.clear()
     threading.Thread(target=_worker, daemon=True).start()
+
+
+def cancel_update_check():
+    """Abort an in-flight update check so it can't delay shutdown.
+
+    Runs without ``_conn_lock`` (the checking thread holds it while
+    blocked): shutting the socket down wakes that thread, which then
+    closes the connection itself and exits without calling back.
+    """
+    _cancelled.set()
+    conn = _conn
+    sock = conn.sock if conn is not None else None
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass